@@ -5,20 +5,49 @@ Complete trading system with risk management, position tracking, and smart alert
 """
 
 import sys
-import os
 import time
+import logging
+import threading
 import signal as sig
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 import argparse
 from typing import List, Dict
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import orjson
 
 from utils.realtime_data import RealTimeDataFetcher
 from strategies.realtime_signals import RealTimeSignalGenerator
-from utils.notifications import NotificationSystem
-from utils.risk_management import RiskManager
+from utils.notifications import Alert, NotificationSystem
+from utils.risk_management import RejectReason, RiskManager
+
+# Console colors for the per-tick status line
+_GREEN = '\\033[92m'
+_RED = '\\033[91m'
+_RESET = '\\033[0m'
+_SIGNAL_COLORS = {
+    'STRONG_BUY': _GREEN,
+    'BUY': _GREEN,
+    'WEAK_BUY': '\\033[93m',
+    'HOLD': '\\033[94m',
+    'WEAK_SELL': '\\033[93m',
+    'SELL': _RED,
+    'STRONG_SELL': _RED
+}
+
+
+# Seconds between portfolio updates
+_PORTFOLIO_UPDATE_INTERVAL = 300
+# Windows cannot interrupt a blocking wait with Ctrl+C, so the main thread waits there in short slices
+_MAX_WAIT = 1.0 if sys.platform == 'win32' else None
+
+
+@lru_cache(maxsize=1)
+def _fmt_hms(t_int: int) -> str:
+    """Format a whole-second epoch time as HH:MM:SS, reusing the string within the same second"""
+    return time.strftime('%H:%M:%S', time.localtime(t_int))
+
 
 class AdvancedRealTimeTrader:
     def __init__(self, symbols: List[str], update_interval: int = 60, initial_capital: float = 10000):
@@ -45,11 +74,22 @@ class AdvancedRealTimeTrader:
         
         self.running = True
         self.trade_log = []
+        self._last_price: Dict[str, float] = {}  # Latest price per symbol, filled by the data callback
+        
+        # Set once on shutdown; the main thread and the alert thread block on it
+        self._stop = threading.Event()
+        # Held while trading on a data update and while the main thread reads the portfolio
+        self._trade_lock = threading.Lock()
+        
+        # Alerts are queued by the data callback and sent in batches by a flusher thread
+        self._alert_q = deque()
+        self._alert_thread = None
         
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print("\\n🛑 Received shutdown signal. Stopping...")
         self.running = False
+        self._stop.set()
         self.data_fetcher.stop_monitoring()
     
     def _on_data_update(self, symbol: str, data, latest_info):
@@ -62,97 +102,118 @@ class AdvancedRealTimeTrader:
             if current_price <= 0:
                 return
             
+            self._last_price[symbol] = current_price
+            
+            # Sample the clock once for the signal, any alerts and the status line
+            t = time.time()
+            now = datetime.fromtimestamp(t)
+            
             # Generate trading signals
-            signal_data = self.signal_generator.generate_composite_signal(symbol, data)
+            signal_data = self.signal_generator.generate_composite_signal(symbol, data, now=now)
             
             # Process trading logic
-            self._process_trading_signals(symbol, current_price, signal_data)
+            with self._trade_lock:
+                self._process_trading_signals(symbol, current_price, signal_data, now)
             
             # Show current status
-            self._show_current_status(symbol, latest_info, signal_data)
+            self._show_current_status(symbol, latest_info, signal_data, t)
             
         except Exception as e:
             print(f"❌ Error processing data for {symbol}: {e}")
     
-    def _process_trading_signals(self, symbol: str, current_price: float, signal_data: Dict):
+    def _process_trading_signals(self, symbol: str, current_price: float, signal_data: Dict, now: datetime = None):
         """Process trading signals and execute trades if appropriate"""
         
-        # Check for position exit first
-        should_exit, exit_reason = self.risk_manager.should_exit_position(symbol, current_price, signal_data)
+        # Check for position exit first; the check and the exit record share one timestamp
+        now_ns = int(now.timestamp() * 1e9) if now is not None else None
+        should_exit, exit_reason = self.risk_manager.should_exit_position(symbol, current_price, signal_data, now_ns)
         if should_exit:
-            exit_record = self.risk_manager.exit_position(symbol, current_price, exit_reason)
-            if exit_record:
-                self.trade_log.append(exit_record)
-                # Send exit notification
-                exit_alert = self._create_exit_alert(exit_record)
-                self.notification_system.send_alert(exit_alert)
+            self._exit_position(symbol, current_price, exit_reason, now, now_ns)
         
         # Check for position entry
         else:
-            should_enter, entry_reason = self.risk_manager.should_enter_position(symbol, signal_data)
-            if should_enter:
+            # Only the outcome is needed here, so skip formatting the reason
+            entry_check, _ = self.risk_manager.check_entry(symbol, signal_data)
+            if entry_check is RejectReason.OK:
                 # Calculate position size
                 confidence_factor = min(signal_data.get('confidence', 0) / 100, 1.0)
                 position_info = self.risk_manager.calculate_position_size(symbol, current_price, confidence_factor)
                 
                 if position_info['shares'] > 0:
                     # Enter position
-                    self.risk_manager.enter_position(symbol, position_info)
+                    self.risk_manager.enter_position(symbol, position_info, now_ns)
                     
                     # Send entry notification
-                    entry_alert = self._create_entry_alert(position_info, signal_data)
-                    self.notification_system.send_alert(entry_alert)
+                    entry_alert = self._create_entry_alert(position_info, signal_data, now)
+                    self._alert_q.append(entry_alert)
             
             # Send regular signal alerts for monitoring
             elif self.signal_generator.should_alert(symbol, signal_data):
-                self.notification_system.send_alert(signal_data)
+                self._alert_q.append(signal_data)
+    
+    def _exit_position(self, symbol: str, price: float, reason: str, now: datetime = None, now_ns: int = None):
+        """Exit a position, log the trade and queue the exit notification"""
+        exit_record = self.risk_manager.exit_position(symbol, price, reason, now_ns)
+        if exit_record:
+            self.trade_log.append(exit_record)
+            # Send exit notification
+            exit_alert = self._create_exit_alert(exit_record, now)
+            self._alert_q.append(exit_alert)
+    
+    def _check_all_exits(self):
+        """
+        Check every open position against its latest price in one pass
+        
+        Catches stop-loss, take-profit and holding-limit exits for symbols whose
+        own updates have stalled; strong-sell exits are left to the per-symbol updates.
+        """
+        t = time.time()
+        now = datetime.fromtimestamp(t)
+        now_ns = int(t * 1e9)
+        with self._trade_lock:
+            for symbol, reason in self.risk_manager.scan_exits(self._last_price, now_ns=now_ns):
+                # A position can only be closed at a known price
+                price = self._last_price.get(symbol)
+                if price is not None:
+                    self._exit_position(symbol, price, reason, now, now_ns)
     
-    def _create_entry_alert(self, position_info: Dict, signal_data: Dict) -> Dict:
+    def _create_entry_alert(self, position_info: Dict, signal_data: Dict, now: datetime = None) -> Alert:
         """Create alert for position entry"""
-        return {
-            'symbol': position_info['symbol'],
-            'overall_signal': f"POSITION_ENTERED",
-            'confidence': signal_data.get('confidence', 0),
-            'timestamp': datetime.now(),
-            'individual_signals': [{
-                'strategy': 'Risk Management',
-                'signal': 'BUY',
-                'strength': 100,
-                'current_price': position_info['entry_price'],
-                'reason': f"Entered {position_info['shares']} shares. Stop: ${position_info['stop_loss_price']:.2f}, Target: ${position_info['take_profit_price']:.2f}"
-            }],
-            'position_info': position_info
-        }
+        return Alert(
+            symbol=position_info['symbol'],
+            signal='POSITION_ENTERED',
+            confidence=signal_data.get('confidence', 0),
+            timestamp=now or datetime.now(),
+            reason=f"Entered {position_info['shares']} shares. Stop: ${position_info['stop_loss_price']:.2f}, Target: ${position_info['take_profit_price']:.2f}",
+            price=position_info['entry_price'],
+            shares=position_info['shares'],
+            stop=position_info['stop_loss_price'],
+            target=position_info['take_profit_price']
+        )
     
-    def _create_exit_alert(self, exit_record: Dict) -> Dict:
+    def _create_exit_alert(self, exit_record: Dict, now: datetime = None) -> Alert:
         """Create alert for position exit"""
-        return {
-            'symbol': exit_record['symbol'],
-            'overall_signal': f"POSITION_EXITED",
-            'confidence': 100,
-            'timestamp': datetime.now(),
-            'individual_signals': [{
-                'strategy': 'Risk Management',
-                'signal': 'SELL',
-                'strength': 100,
-                'current_price': exit_record['exit_price'],
-                'reason': f"Exited {exit_record['shares']} shares. P&L: ${exit_record['pnl']:+.2f} ({exit_record['pnl_percent']:+.1f}%). Reason: {exit_record['reason']}"
-            }],
-            'exit_record': exit_record
-        }
+        return Alert(
+            symbol=exit_record['symbol'],
+            signal='POSITION_EXITED',
+            confidence=100,
+            timestamp=now or datetime.now(),
+            reason=f"Exited {exit_record['shares']} shares. P&L: ${exit_record['pnl']:+.2f} ({exit_record['pnl_percent']:+.1f}%). Reason: {exit_record['reason']}",
+            price=exit_record['exit_price'],
+            shares=exit_record['shares']
+        )
     
-    def _show_current_status(self, symbol: str, latest_info, signal_data):
+    def _show_current_status(self, symbol: str, latest_info, signal_data, t: float = None):
         """Show current status for a symbol"""
         price = latest_info.get('price', 0)
         change = latest_info.get('change', 0)
         change_percent = latest_info.get('change_percent', 0)
         signal = signal_data.get('overall_signal', 'HOLD')
         confidence = signal_data.get('confidence', 0)
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = _fmt_hms(int(t if t is not None else time.time()))
         
         # Color for price change
-        color = '\\033[92m' if change >= 0 else '\\033[91m'
-        reset = '\\033[0m'
+        color = _GREEN if change >= 0 else _RED
         
         # Position indicator
         position_indicator = ""
@@ -162,37 +223,24 @@ class AdvancedRealTimeTrader:
             shares = position['shares']
             current_pnl = shares * (price - entry_price)
             pnl_percent = (current_pnl / position['position_value']) * 100
-            pnl_color = '\\033[92m' if current_pnl >= 0 else '\\033[91m'
-            position_indicator = f" | {pnl_color}[POS: {shares} @ ${entry_price:.2f} P&L: ${current_pnl:+.2f} ({pnl_percent:+.1f}%)]{reset}"
+            pnl_color = _GREEN if current_pnl >= 0 else _RED
+            position_indicator = f" | {pnl_color}[POS: {shares} @ ${entry_price:.2f} P&L: ${current_pnl:+.2f} ({pnl_percent:+.1f}%)]{_RESET}"
         
-        # Signal color
-        signal_colors = {
-            'STRONG_BUY': '\\033[92m',
-            'BUY': '\\033[92m',
-            'WEAK_BUY': '\\033[93m',
-            'HOLD': '\\033[94m',
-            'WEAK_SELL': '\\033[93m',
-            'SELL': '\\033[91m',
-            'STRONG_SELL': '\\033[91m'
-        }
-        signal_color = signal_colors.get(signal, '\\033[0m')
+        signal_color = _SIGNAL_COLORS.get(signal, _RESET)
         
-        print(f"[{timestamp}] {symbol}: {color}${price:.2f} ({change:+.2f}, {change_percent:+.2f}%){reset} | {signal_color}{signal} ({confidence:.1f}%){reset}{position_indicator}")
+        print(f"[{timestamp}] {symbol}: {color}${price:.2f} ({change:+.2f}, {change_percent:+.2f}%){_RESET} | {signal_color}{signal} ({confidence:.1f}%){_RESET}{position_indicator}")
     
     def _show_portfolio_update(self):
         """Show periodic portfolio update"""
-        current_prices = {}
-        for symbol in self.risk_manager.current_positions.keys():
-            data = self.data_fetcher.get_cached_data(symbol)
-            if not data.empty:
-                current_prices[symbol] = data['Close'].iloc[-1]
-        
-        # Update daily P&L
-        total_daily_pnl = self.risk_manager.update_daily_pnl(current_prices)
-        
-        # Get portfolio summary
-        portfolio = self.risk_manager.get_portfolio_summary()
-        risk_metrics = self.risk_manager.get_risk_metrics()
+        with self._trade_lock:
+            current_prices = {s: self._last_price[s] for s in self.risk_manager.current_positions if s in self._last_price}
+            
+            # Update daily P&L
+            total_daily_pnl = self.risk_manager.update_daily_pnl(current_prices)
+            
+            # Get portfolio summary
+            portfolio = self.risk_manager.get_portfolio_summary()
+            risk_metrics = self.risk_manager.get_risk_metrics()
         
         print("\\n" + "="*80)
         print("💼 PORTFOLIO UPDATE")
@@ -202,6 +250,19 @@ class AdvancedRealTimeTrader:
         print(f"Positions: {portfolio['num_positions']} | Portfolio Risk: {risk_metrics['current_portfolio_risk']:.1f}%")
         print("="*80 + "\\n")
     
+    def _flush_alerts(self):
+        """Send every queued alert as one batch"""
+        drain = []
+        while self._alert_q:
+            drain.append(self._alert_q.popleft())
+        if drain:
+            self.notification_system.send_alerts_bulk(drain)
+    
+    def _alert_loop(self):
+        """Flush queued alerts every 0.5 seconds until the trader stops"""
+        while not self._stop.wait(0.5):
+            self._flush_alerts()
+    
     def start(self):
         """Start real-time monitoring with advanced features"""
         print("🚀 Advanced Real-Time Trading System")
@@ -224,23 +285,37 @@ class AdvancedRealTimeTrader:
         # Start monitoring
         self.data_fetcher.start_monitoring()
         
-        last_portfolio_update = time.time()
+        self._alert_thread = threading.Thread(target=self._alert_loop, daemon=True)
+        self._alert_thread.start()
         
         try:
-            # Keep the main thread alive
-            while self.running:
-                time.sleep(1)
-                
-                # Show portfolio update every 5 minutes
-                if time.time() - last_portfolio_update > 300:  # 5 minutes
+            # Sleep until the next portfolio update is due or a shutdown signal sets the stop event
+            next_pu = time.monotonic() + _PORTFOLIO_UPDATE_INTERVAL
+            while True:
+                timeout = max(0.0, next_pu - time.monotonic())
+                if _MAX_WAIT is not None:
+                    timeout = min(timeout, _MAX_WAIT)
+                if self._stop.wait(timeout):
+                    break
+                if time.monotonic() < next_pu:
+                    continue
+                try:
+                    self._check_all_exits()
                     self._show_portfolio_update()
-                    last_portfolio_update = time.time()
-                
+                except Exception as e:
+                    print(f"❌ Error showing portfolio update: {e}")
+                next_pu += _PORTFOLIO_UPDATE_INTERVAL
+            
         except KeyboardInterrupt:
             print("\\n🛑 Stopping monitoring...")
         
         finally:
+            self.running = False
+            self._stop.set()
             self.data_fetcher.stop_monitoring()
+            if self._alert_thread:
+                self._alert_thread.join()
+            self._flush_alerts()
             print("\\n📊 Final Summary:")
             self._show_final_summary()
     
@@ -302,20 +377,12 @@ class AdvancedRealTimeTrader:
         
         # Save trade log
         if self.trade_log:
-            import json
             trade_file = f"trades_{timestamp}.json"
             try:
-                # Convert datetime objects to strings
-                trade_log_json = []
-                for trade in self.trade_log:
-                    trade_copy = trade.copy()
-                    for key, value in trade_copy.items():
-                        if isinstance(value, datetime):
-                            trade_copy[key] = value.isoformat()
-                    trade_log_json.append(trade_copy)
-                
-                with open(trade_file, 'w') as f:
-                    json.dump(trade_log_json, f, indent=2)
+                # orjson serializes datetime and NumPy scalars natively, no per-trade copy needed
+                payload = orjson.dumps(self.trade_log, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+                with open(trade_file, 'wb') as f:
+                    f.write(payload)
                 print(f"💾 Trade log saved to: {trade_file}")
             except Exception as e:
                 print(f"❌ Failed to save trade log: {e}")
@@ -333,6 +400,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Show trade entries and exits from the risk manager alongside the console output
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logging.getLogger('utils.risk_management').setLevel(logging.INFO)
+    
     if args.test:
         print("🧪 Testing notification system...")
         notification_system = NotificationSystem()
@@ -1,13 +1,132 @@
 import pandas as pd
 import numpy as np
+from numba import njit, prange, types
 from typing import Dict, List, Tuple
 
+# Kernels are compiled eagerly from their explicit signatures at import time;
+# cache=True persists the machine code as .nbi/.nbc files under __pycache__/
+# so later runs load it instead of recompiling. Array inputs are declared
+# read-only so the read-only views pandas returns from to_numpy() are accepted
+# without a copy (writable arrays are accepted as well).
+_F64_IN = types.Array(types.float64, 1, 'A', readonly=True)
+
+
+@njit(types.Tuple((types.float64[:], types.float64[:], types.float64[:], types.int64[:],
+                   types.int64[:], types.float64[:], types.float64[:], types.boolean[:], types.int64))(
+          _F64_IN, _F64_IN, types.float64, types.float64), cache=True)
+def _simulate(price, positions, initial_capital, commission):
+    """
+    Buy/sell simulation compiled to native code
+    
+    Only the bars where positions is +1/-1 are visited; holdings and cash are
+    constant between those events, so they are filled in slices and the total
+    curve is computed in one vectorized pass at the end.
+    
+    Returns:
+    tuple: (holdings, cash, total, trade_idx, trade_shares, trade_px, trade_cashflow, trade_is_buy, n_trades)
+    """
+    n = price.shape[0]
+    holdings = np.zeros(n)
+    cash = np.full(n, initial_capital)
+    
+    events = np.flatnonzero((positions == 1.0) | (positions == -1.0))
+    
+    trade_idx = np.empty(events.size, dtype=np.int64)
+    trade_shares = np.empty(events.size, dtype=np.int64)
+    trade_px = np.empty(events.size)
+    trade_cashflow = np.empty(events.size)
+    trade_is_buy = np.empty(events.size, dtype=np.bool_)
+    n_trades = 0
+    
+    current_cash = initial_capital
+    shares = 0
+    buy_mul = 1.0 + commission
+    sell_mul = 1.0 - commission
+    last = 0
+    
+    for i in events:
+        if i == 0:
+            continue
+        
+        # Carry the state forward up to this event
+        holdings[last:i] = shares
+        cash[last:i] = current_cash
+        last = i
+        bar_price = price[i]
+        
+        if positions[i] == 1.0:  # Buy signal
+            # Size the order against the commission-inclusive price so it is always affordable
+            buy_px = bar_price * buy_mul
+            shares_to_buy = int(current_cash // buy_px)
+            if shares_to_buy > 0:
+                cost = shares_to_buy * buy_px
+                shares += shares_to_buy
+                current_cash -= cost
+                trade_idx[n_trades] = i
+                trade_shares[n_trades] = shares_to_buy
+                trade_px[n_trades] = bar_price
+                trade_cashflow[n_trades] = -cost
+                trade_is_buy[n_trades] = True
+                n_trades += 1
+                    
+        else:  # Sell signal
+            if shares > 0:
+                proceeds = shares * bar_price * sell_mul
+                current_cash += proceeds
+                trade_idx[n_trades] = i
+                trade_shares[n_trades] = shares
+                trade_px[n_trades] = bar_price
+                trade_cashflow[n_trades] = proceeds
+                trade_is_buy[n_trades] = False
+                n_trades += 1
+                shares = 0
+    
+    holdings[last:] = shares
+    cash[last:] = current_cash
+    total = cash + holdings * price
+    
+    return holdings, cash, total, trade_idx, trade_shares, trade_px, trade_cashflow, trade_is_buy, n_trades
+
+
+@njit(types.float64[:, ::1](types.float64[:, ::1], types.float64[:, ::1], types.float64, types.float64),
+      cache=True, parallel=True)
+def _batch_simulate(prices_2d, positions_2d, initial_capital, commission):
+    """Run _simulate on every row of a (n_symbols, n_bars) matrix in parallel, returning the total curves"""
+    n_symbols, n_bars = prices_2d.shape
+    total_curves = np.empty((n_symbols, n_bars))
+    for s in prange(n_symbols):
+        total_curves[s] = _simulate(prices_2d[s], positions_2d[s], initial_capital, commission)[2]
+    return total_curves
+
+
+@njit(types.float64(_F64_IN), cache=True)
+def _max_dd(total):
+    """Maximum drawdown of an equity curve in a single pass"""
+    if total.size == 0:
+        return 0.0
+    
+    peak = total[0]
+    mdd = 0.0
+    for i in range(1, total.size):
+        if total[i] > peak:
+            peak = total[i]
+        dd = (total[i] - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    return mdd
+
+
 class Backtester:
     def __init__(self, initial_capital=10000, commission=0.001):
         self.initial_capital = initial_capital
         self.commission = commission
         self.portfolio = None
-        self.trades = []
+        self._trade_columns = None
+    
+    @property
+    def trades(self) -> List[Dict]:
+        """Trades from the last backtest as a list of dicts"""
+        return self.get_trade_summary().to_dict('records')
     
     def run_backtest(self, data: pd.DataFrame, strategy_signals: pd.DataFrame) -> Dict:
         """
@@ -20,81 +139,77 @@ class Backtester:
         Returns:
         dict: Backtest results
         """
-        portfolio = pd.DataFrame(index=data.index)
-        portfolio['price'] = data['Close']
-        portfolio['signal'] = strategy_signals['signal']
-        portfolio['positions'] = strategy_signals['positions']
-        
-        # Calculate holdings
-        portfolio['holdings'] = 0.0
-        portfolio['cash'] = self.initial_capital
-        portfolio['total'] = self.initial_capital
-        
-        current_cash = self.initial_capital
-        current_holdings = 0.0
-        
-        for i, (date, row) in enumerate(portfolio.iterrows()):
-            if i == 0:
-                continue
-                
-            price = row['price']
-            position_change = row['positions']
-            
-            # Execute trades
-            if position_change == 1.0:  # Buy signal
-                if current_cash > 0:
-                    shares_to_buy = int(current_cash / price)
-                    cost = shares_to_buy * price * (1 + self.commission)
-                    if cost <= current_cash:
-                        current_holdings += shares_to_buy
-                        current_cash -= cost
-                        self.trades.append({
-                            'date': date,
-                            'type': 'BUY',
-                            'shares': shares_to_buy,
-                            'price': price,
-                            'cost': cost
-                        })
-                        
-            elif position_change == -1.0:  # Sell signal
-                if current_holdings > 0:
-                    proceeds = current_holdings * price * (1 - self.commission)
-                    current_cash += proceeds
-                    self.trades.append({
-                        'date': date,
-                        'type': 'SELL',
-                        'shares': current_holdings,
-                        'price': price,
-                        'proceeds': proceeds
-                    })
-                    current_holdings = 0.0
-            
-            portfolio.loc[date, 'holdings'] = current_holdings
-            portfolio.loc[date, 'cash'] = current_cash
-            portfolio.loc[date, 'total'] = current_cash + current_holdings * price
-        
-        self.portfolio = portfolio
+        price = data['Close'].to_numpy(dtype=np.float64)
+        positions = strategy_signals['positions'].to_numpy(dtype=np.float64)
+        
+        (holdings, cash, total, trade_idx, trade_shares, trade_px,
+         trade_cashflow, trade_is_buy, n_trades) = _simulate(
+            price, positions, float(self.initial_capital), float(self.commission))
+        
+        # Keep the trade ledger columnar; cashflow is negative for buys (cost) and positive for sells (proceeds)
+        self._trade_columns = {
+            'date': data.index[trade_idx[:n_trades]],
+            'type': np.where(trade_is_buy[:n_trades], 'BUY', 'SELL'),
+            'shares': trade_shares[:n_trades],
+            'price': trade_px[:n_trades],
+            'cashflow': trade_cashflow[:n_trades]
+        }
+        
+        self.portfolio = pd.DataFrame({
+            'price': price,
+            'signal': strategy_signals['signal'].to_numpy(),
+            'positions': positions,
+            'holdings': holdings,
+            'cash': cash,
+            'total': total
+        }, index=data.index)
         return self.calculate_metrics()
     
+    def run_batch_backtest(self, data: Dict[str, pd.DataFrame], strategy_signals: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Run the same backtest over several symbols in parallel
+        
+        Parameters:
+        data (dict): Symbol -> stock price data
+        strategy_signals (dict): Symbol -> strategy signals
+        
+        Returns:
+        pd.DataFrame: Portfolio total per symbol (one column per symbol) on the common dates
+        """
+        symbols = list(data)
+        closes = pd.concat({symbol: data[symbol]['Close'] for symbol in symbols}, axis=1, join='inner')
+        positions = pd.concat({symbol: strategy_signals[symbol]['positions'] for symbol in symbols}, axis=1)
+        positions = positions.reindex(closes.index).fillna(0.0)
+        
+        prices_2d = np.vstack([closes[symbol].to_numpy(dtype=np.float64) for symbol in symbols])
+        positions_2d = np.vstack([positions[symbol].to_numpy(dtype=np.float64) for symbol in symbols])
+        
+        total_curves = _batch_simulate(prices_2d, positions_2d, float(self.initial_capital), float(self.commission))
+        return pd.DataFrame(total_curves.T, index=closes.index, columns=symbols)
+    
     def calculate_metrics(self) -> Dict:
         """Calculate performance metrics"""
         if self.portfolio is None:
             return {}
         
-        total_return = (self.portfolio['total'].iloc[-1] - self.initial_capital) / self.initial_capital
+        total = self.portfolio['total'].to_numpy(dtype=np.float64)
+        total_return = (total[-1] - self.initial_capital) / self.initial_capital
         
-        # Calculate daily returns
-        daily_returns = self.portfolio['total'].pct_change().dropna()
+        # Calculate daily returns straight from the equity array
+        daily_returns = np.diff(total)
+        daily_returns /= total[:-1]
+        mean_return = daily_returns.mean() if daily_returns.size > 0 else np.nan
+        std_return = daily_returns.std(ddof=1) if daily_returns.size > 1 else np.nan
         
         # Calculate key metrics
         metrics = {
             'total_return': total_return,
-            'annual_return': (1 + total_return) ** (252 / len(self.portfolio)) - 1,
-            'volatility': daily_returns.std() * np.sqrt(252),
-            'sharpe_ratio': daily_returns.mean() / daily_returns.std() * np.sqrt(252) if daily_returns.std() > 0 else 0,
-            'max_drawdown': self.calculate_max_drawdown(),
-            'total_trades': len(self.trades),
-            'final_portfolio_value': self.portfolio['total'].iloc[-1],
+            'annual_return': (1 + total_return) ** (252 / len(total)) - 1,
+            'volatility': std_return * np.sqrt(252),
+            'sharpe_ratio': mean_return / std_return * np.sqrt(252) if std_return > 0 else 0,
+            'max_drawdown': _max_dd(total),
+            'total_trades': len(self._trade_columns['date']) if self._trade_columns else 0,
+            'final_portfolio_value': total[-1],
             'initial_capital': self.initial_capital
         }
         
@@ -105,13 +220,11 @@ class Backtester:
         if self.portfolio is None:
             return 0
         
-        peak = self.portfolio['total'].cummax()
-        drawdown = (self.portfolio['total'] - peak) / peak
-        return drawdown.min()
+        return _max_dd(self.portfolio['total'].to_numpy(dtype=np.float64))
     
     def get_trade_summary(self) -> pd.DataFrame:
         """Get summary of all trades"""
-        if not self.trades:
+        if not self._trade_columns or len(self._trade_columns['date']) == 0:
             return pd.DataFrame()
         
-        return pd.DataFrame(self.trades)
\ No newline at end of file
+        return pd.DataFrame(self._trade_columns)
\ No newline at end of file
@@ -4,10 +4,6 @@ Quick Demo of Real-Time Trading Signals
 Shows how the system analyzes stocks and generates signals
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 from utils.realtime_data import RealTimeDataFetcher
 from strategies.realtime_signals import RealTimeSignalGenerator
 from utils.notifications import NotificationSystem
@@ -1,9 +1,7 @@
 """
 Main script demonstrating algorithmic trading setup
 """
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_fetcher import DataFetcher
 from strategies.simple_moving_average import SimpleMovingAverageStrategy
@@ -54,6 +52,9 @@ def main():
         
         # Create visualization
         print("\n📈 Creating visualization...")
+        # Let matplotlib drop near-collinear segments when rasterizing long series
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['path.simplify_threshold'] = 1.0
         plt.figure(figsize=(12, 8))
         
         # Plot price and moving averages
@@ -76,7 +77,10 @@ def main():
         
         # Plot portfolio value
         plt.subplot(2, 1, 2)
-        plt.plot(backtester.portfolio.index, backtester.portfolio['total'], label='Portfolio Value', color='purple')
+        # ~2000 points look identical on screen, so decimate long (e.g. intraday) equity curves
+        total = backtester.portfolio['total'].to_numpy()
+        stride = max(1, len(total) // 2000)
+        plt.plot(backtester.portfolio.index[::stride], total[::stride], label='Portfolio Value', color='purple')
         plt.title('Portfolio Value Over Time')
         plt.ylabel('Portfolio Value ($)')
         plt.xlabel('Date')
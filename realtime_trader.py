@@ -4,26 +4,55 @@ Real-Time Trading Signal Generator
 Monitors stocks and provides live buy/sell suggestions
 """
 
-import sys
 import os
+import sys
 import time
+import queue
+import threading
 import signal as sig
 from datetime import datetime
+from functools import lru_cache
 import argparse
-from typing import List
-
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from typing import Dict, List
 
 from utils.realtime_data import RealTimeDataFetcher
 from strategies.realtime_signals import RealTimeSignalGenerator
 from utils.notifications import NotificationSystem
 
+# Console colors for the per-tick status line
+_GREEN = '\\033[92m'
+_RED = '\\033[91m'
+_RESET = '\\033[0m'
+_SIGNAL_COLORS = {
+    'STRONG_BUY': _GREEN,
+    'BUY': _GREEN,
+    'WEAK_BUY': '\\033[93m',
+    'HOLD': '\\033[94m',
+    'WEAK_SELL': '\\033[93m',
+    'SELL': _RED,
+    'STRONG_SELL': _RED
+}
+
+
+@lru_cache(maxsize=1)
+def _fmt_hms(t_int: int) -> str:
+    """Format a whole-second epoch time as HH:MM:SS, reusing the string within the same second"""
+    return time.strftime('%H:%M:%S', time.localtime(t_int))
+
+
 class RealTimeTrader:
-    def __init__(self, symbols: List[str], update_interval: int = 60):
+    def __init__(self, symbols: List[str], update_interval: int = 60, verbose: bool = True,
+                 min_print_interval: float = 0.0, min_alert_interval: float = 0.0):
         self.symbols = symbols
         self.update_interval = update_interval
         
+        # Per-symbol rate limits (seconds) for the status line and for alerts
+        self.verbose = verbose
+        self.min_print_interval = min_print_interval
+        self.min_alert_interval = min_alert_interval
+        self._last_print_ts: Dict[str, float] = {}
+        self._last_alert_ts: Dict[str, float] = {}
+        
         # Initialize components
         self.data_fetcher = RealTimeDataFetcher(update_interval=update_interval)
         self.signal_generator = RealTimeSignalGenerator()
@@ -38,6 +67,21 @@ class RealTimeTrader:
         sig.signal(sig.SIGTERM, self._signal_handler)
         
         self.running = True
+        
+        # Updates are handed from the fetcher thread to worker threads. Each symbol keeps only
+        # its latest pending update; the queues carry symbols that have one waiting, at most once
+        # each. A symbol always maps to the same worker, so its signal state has one writer.
+        n_workers = max(1, min(len(symbols), os.cpu_count() or 1))
+        self._queues = [queue.Queue() for _ in range(n_workers)]
+        self._pending: Dict[str, tuple] = {}  # symbol -> (data, latest_info)
+        self._pending_lock = threading.Lock()
+        self._workers = []
+        
+        # Status lines are buffered and written in one go every 200 ms by a flusher thread
+        self._out_buf: List[str] = []
+        self._out_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flush_thread = None
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -46,50 +90,81 @@ class RealTimeTrader:
         self.data_fetcher.stop_monitoring()
     
     def _on_data_update(self, symbol: str, data, latest_info):
-        """Callback function for when data is updated"""
+        """Callback function for when data is updated; queues the update for a worker"""
+        with self._pending_lock:
+            # A newer update replaces one for the same symbol that is still waiting
+            already_queued = symbol in self._pending
+            self._pending[symbol] = (data, latest_info)
+        if not already_queued:
+            self._queues[hash(symbol) % len(self._queues)].put(symbol)
+    
+    def _worker_loop(self, q: queue.Queue):
+        """Process the latest update of each queued symbol until a None sentinel arrives"""
+        while True:
+            symbol = q.get()
+            if symbol is None:
+                break
+            with self._pending_lock:
+                data, latest_info = self._pending.pop(symbol)
+            self._process_update(symbol, data, latest_info)
+    
+    def _process_update(self, symbol: str, data, latest_info):
+        """Generate signals, alerts and the status line for one data update"""
         try:
             if data.empty or not latest_info:
                 return
             
+            # Sample the clock once for the signal timestamp and the status line
+            t = time.time()
+            
             # Generate trading signals
-            signal_data = self.signal_generator.generate_composite_signal(symbol, data)
+            signal_data = self.signal_generator.generate_composite_signal(symbol, data, now=datetime.fromtimestamp(t))
+            now = time.monotonic()
             
-            # Check if we should send an alert
-            if self.signal_generator.should_alert(symbol, signal_data):
-                self.notification_system.send_alert(signal_data)
+            # Check if we should send an alert; within min_alert_interval of the last one the
+            # check is deferred, so a changed signal still alerts once the window has passed
+            if now - self._last_alert_ts.get(symbol, float('-inf')) >= self.min_alert_interval:
+                if self.signal_generator.should_alert(symbol, signal_data):
+                    self._last_alert_ts[symbol] = now
+                    self.notification_system.send_alert(signal_data)
             
-            # Always show current status (less verbose)
-            self._show_current_status(symbol, latest_info, signal_data)
+            # Show current status (less verbose), at most once per min_print_interval
+            if self.verbose and now - self._last_print_ts.get(symbol, float('-inf')) >= self.min_print_interval:
+                self._last_print_ts[symbol] = now
+                self._show_current_status(symbol, latest_info, signal_data, t)
             
         except Exception as e:
             print(f"❌ Error processing data for {symbol}: {e}")
     
-    def _show_current_status(self, symbol: str, latest_info, signal_data):
+    def _show_current_status(self, symbol: str, latest_info, signal_data, t: float = None):
         """Show current status for a symbol"""
         price = latest_info.get('price', 0)
         change = latest_info.get('change', 0)
         change_percent = latest_info.get('change_percent', 0)
         signal = signal_data.get('overall_signal', 'HOLD')
         confidence = signal_data.get('confidence', 0)
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = _fmt_hms(int(t if t is not None else time.time()))
         
         # Color for price change
-        color = '\\033[92m' if change >= 0 else '\\033[91m'  # Green for positive, red for negative
-        reset = '\\033[0m'
-        
-        # Signal color
-        signal_colors = {
-            'STRONG_BUY': '\\033[92m',
-            'BUY': '\\033[92m',
-            'WEAK_BUY': '\\033[93m',
-            'HOLD': '\\033[94m',
-            'WEAK_SELL': '\\033[93m',
-            'SELL': '\\033[91m',
-            'STRONG_SELL': '\\033[91m'
-        }
-        signal_color = signal_colors.get(signal, '\\033[0m')
-        
-        print(f"[{timestamp}] {symbol}: {color}${price:.2f} ({change:+.2f}, {change_percent:+.2f}%){reset} | {signal_color}{signal} ({confidence:.1f}%){reset}")
+        color = _GREEN if change >= 0 else _RED
+        signal_color = _SIGNAL_COLORS.get(signal, _RESET)
+        
+        line = f"[{timestamp}] {symbol}: {color}${price:.2f} ({change:+.2f}, {change_percent:+.2f}%){_RESET} | {signal_color}{signal} ({confidence:.1f}%){_RESET}\n"
+        with self._out_lock:
+            self._out_buf.append(line)
+    
+    def _flush_output(self):
+        """Write all buffered status lines with a single write"""
+        with self._out_lock:
+            buf, self._out_buf = self._out_buf, []
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+    
+    def _flush_loop(self):
+        """Flush buffered output every 200 ms until the trader stops"""
+        while not self._stop.wait(0.2):
+            self._flush_output()
     
     def start(self):
         """Start real-time monitoring"""
@@ -102,7 +177,12 @@ class RealTimeTrader:
         print("💡 Press Ctrl+C to stop monitoring")
         print("\\n📈 Live Data Feed:")
         
-        # Add callback for data updates
+        # Start the workers, then add callback for data updates
+        self._workers = [threading.Thread(target=self._worker_loop, args=(q,), daemon=True) for q in self._queues]
+        for worker in self._workers:
+            worker.start()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
         self.data_fetcher.add_callback(self._on_data_update)
         
         # Start monitoring
@@ -118,6 +198,15 @@ class RealTimeTrader:
         
         finally:
             self.data_fetcher.stop_monitoring()
+            # Let the workers finish what is already queued
+            for q in self._queues:
+                q.put(None)
+            for worker in self._workers:
+                worker.join()
+            self._stop.set()
+            if self._flush_thread:
+                self._flush_thread.join()
+            self._flush_output()
             print("\\n📊 Final Summary:")
             self._show_summary()
     
@@ -157,6 +246,9 @@ class RealTimeTrader:
         if symbol in self.symbols:
             self.symbols.remove(symbol)
             self.data_fetcher.remove_symbol(symbol)
+            self.signal_generator.forget_symbol(symbol)
+            self._last_print_ts.pop(symbol, None)
+            self._last_alert_ts.pop(symbol, None)
 
 def main():
     parser = argparse.ArgumentParser(description='Real-Time Trading Signal Generator')
@@ -166,6 +258,12 @@ def main():
                         help='Update interval in seconds (default: 60)')
     parser.add_argument('--test', action='store_true',
                         help='Run notification test and exit')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Only show alerts, not the per-update status line')
+    parser.add_argument('--min-print-interval', type=float, default=0.0,
+                        help='Minimum seconds between status lines per symbol (default: 0)')
+    parser.add_argument('--min-alert-interval', type=float, default=0.0,
+                        help='Minimum seconds between alerts per symbol (default: 0)')
     
     args = parser.parse_args()
     
@@ -183,7 +281,9 @@ def main():
         return
     
     # Create and start trader
-    trader = RealTimeTrader(symbols, args.interval)
+    trader = RealTimeTrader(symbols, args.interval, verbose=not args.quiet,
+                            min_print_interval=args.min_print_interval,
+                            min_alert_interval=args.min_alert_interval)
     trader.start()
 
 if __name__ == "__main__":
@@ -43,34 +43,36 @@ def main():
     
     # Prepare the command
     if choice == "1":
-        command = "source venv/bin/activate && python realtime_trader.py AAPL GOOGL MSFT TSLA"
+        args = ["realtime_trader.py", "AAPL", "GOOGL", "MSFT", "TSLA"]
         print("🔥 Starting Basic Real-Time Trader...")
     elif choice == "2":
-        command = "source venv/bin/activate && python advanced_realtime_trader.py AAPL GOOGL MSFT TSLA"
+        args = ["advanced_realtime_trader.py", "AAPL", "GOOGL", "MSFT", "TSLA"]
         print("🔥 Starting Advanced Real-Time Trader...")
     elif choice == "3":
-        command = "source venv/bin/activate && python demo.py"
+        args = ["demo.py"]
         print("🔥 Running Demo...")
     elif choice == "4":
-        command = "source venv/bin/activate && python realtime_trader.py --test"
+        args = ["realtime_trader.py", "--test"]
         print("🔥 Testing Notifications...")
     else:
-        command = "source venv/bin/activate && python demo.py"
+        args = ["demo.py"]
         print("🔥 Running Demo (default choice)...")
     
     print("\n" + "=" * 50)
     print("🚨 IMPORTANT: Press Ctrl+C to stop the trader")
     print("=" * 50)
     
-    # Execute the command
+    # Use the virtual environment's interpreter when there is one
+    python = os.path.join("venv", "bin", "python")
+    if not os.path.exists(python):
+        python = sys.executable
+    
+    # Replace this process with the chosen script; no shell and no extra child process
+    sys.stdout.flush()
     try:
-        subprocess.run(command, shell=True)
-    except KeyboardInterrupt:
-        print("\n🛑 Trading session stopped by user")
-    except Exception as e:
+        os.execv(python, [python] + args)
+    except OSError as e:
         print(f"❌ Error: {e}")
-    
-    print("\n✅ Session ended. Thank you for using the trading system!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
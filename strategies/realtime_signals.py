@@ -1,243 +1,326 @@
 import pandas as pd
 import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
+from enum import IntEnum
 from typing import Dict, List, Optional, Tuple
 from .custom_indicators import TechnicalIndicators
+from .streaming_indicators import StreamingIndicators
+
+class Sig(IntEnum):
+    """Per-strategy signal states; the member name is the label stored in signal dicts"""
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+    HOLD_BULLISH = 3
+    HOLD_BEARISH = 4
+    HOLD_OVERSOLD = 5
+    HOLD_OVERBOUGHT = 6
+    HOLD_NEUTRAL = 7
+
+
+# Signal id for each label, so voting can bincount ids instead of comparing strings
+_SIG_IDS = {sig.name: int(sig) for sig in Sig}
+
+# Number of alerted signals kept in signals_history
+_SIGNALS_HISTORY_SIZE = 1000
+
+# Scalar classifiers shared by the full-history calculate_*_signals methods and the
+# streaming path in generate_composite_signal
+
+def _sma_signal(current_price, short_ma, long_ma, prev_short_ma, prev_long_ma, short_window=20, long_window=50) -> Dict:
+    """Classify the latest SMA crossover state"""
+    # Determine signal
+    signal = 'HOLD'
+    strength = 0
+    reason = ''
+    
+    # Check for crossover
+    if short_ma > long_ma and prev_short_ma <= prev_long_ma:
+        signal = 'BUY'
+        strength = min(((short_ma - long_ma) / long_ma) * 100, 100)
+        reason = f'SMA crossover: {short_window}-day MA crossed above {long_window}-day MA'
+    elif short_ma < long_ma and prev_short_ma >= prev_long_ma:
+        signal = 'SELL'
+        strength = min(((long_ma - short_ma) / long_ma) * 100, 100)
+        reason = f'SMA crossover: {short_window}-day MA crossed below {long_window}-day MA'
+    elif short_ma > long_ma:
+        signal = 'HOLD_BULLISH'
+        strength = min(((short_ma - long_ma) / long_ma) * 100, 100)
+        reason = f'Bullish trend: {short_window}-day MA above {long_window}-day MA'
+    else:
+        signal = 'HOLD_BEARISH'
+        strength = min(((long_ma - short_ma) / long_ma) * 100, 100)
+        reason = f'Bearish trend: {short_window}-day MA below {long_window}-day MA'
+    
+    return {
+        'signal': signal,
+        'strength': round(strength, 2),
+        'reason': reason,
+        'current_price': current_price,
+        'short_ma': round(short_ma, 2),
+        'long_ma': round(long_ma, 2),
+        'strategy': 'SMA'
+    }
+
+
+def _rsi_signal(current_price, current_rsi, prev_rsi, oversold=30, overbought=70) -> Dict:
+    """Classify the latest RSI level"""
+    signal = 'HOLD'
+    strength = 0
+    reason = ''
+    
+    if current_rsi <= oversold and prev_rsi > oversold:
+        signal = 'BUY'
+        strength = (oversold - current_rsi) / oversold * 100
+        reason = f'RSI oversold: {current_rsi:.1f} (threshold: {oversold})'
+    elif current_rsi >= overbought and prev_rsi < overbought:
+        signal = 'SELL'
+        strength = (current_rsi - overbought) / (100 - overbought) * 100
+        reason = f'RSI overbought: {current_rsi:.1f} (threshold: {overbought})'
+    elif current_rsi <= oversold:
+        signal = 'HOLD_OVERSOLD'
+        strength = (oversold - current_rsi) / oversold * 100
+        reason = f'RSI oversold territory: {current_rsi:.1f}'
+    elif current_rsi >= overbought:
+        signal = 'HOLD_OVERBOUGHT'
+        strength = (current_rsi - overbought) / (100 - overbought) * 100
+        reason = f'RSI overbought territory: {current_rsi:.1f}'
+    else:
+        signal = 'HOLD_NEUTRAL'
+        strength = 0
+        reason = f'RSI neutral: {current_rsi:.1f}'
+    
+    return {
+        'signal': signal,
+        'strength': round(strength, 2),
+        'reason': reason,
+        'current_price': current_price,
+        'rsi': round(current_rsi, 2),
+        'strategy': 'RSI'
+    }
+
+
+def _macd_signal(current_price, current_macd, current_signal, current_histogram, prev_macd, prev_signal) -> Dict:
+    """Classify the latest MACD/signal line relationship"""
+    signal = 'HOLD'
+    strength = 0
+    reason = ''
+    
+    # Check for signal line crossover
+    if current_macd > current_signal and prev_macd <= prev_signal:
+        signal = 'BUY'
+        strength = min(abs(current_macd - current_signal) * 100, 100)
+        reason = 'MACD bullish crossover: MACD line crossed above signal line'
+    elif current_macd < current_signal and prev_macd >= prev_signal:
+        signal = 'SELL'
+        strength = min(abs(current_macd - current_signal) * 100, 100)
+        reason = 'MACD bearish crossover: MACD line crossed below signal line'
+    elif current_macd > current_signal:
+        signal = 'HOLD_BULLISH'
+        strength = min(abs(current_macd - current_signal) * 100, 100)
+        reason = 'MACD bullish: MACD line above signal line'
+    else:
+        signal = 'HOLD_BEARISH'
+        strength = min(abs(current_macd - current_signal) * 100, 100)
+        reason = 'MACD bearish: MACD line below signal line'
+    
+    return {
+        'signal': signal,
+        'strength': round(strength, 2),
+        'reason': reason,
+        'current_price': current_price,
+        'macd': round(current_macd, 4),
+        'macd_signal': round(current_signal, 4),
+        'macd_histogram': round(current_histogram, 4),
+        'strategy': 'MACD'
+    }
+
+
+def _bb_signal(current_price, prev_price, bb_upper, bb_middle, bb_lower) -> Dict:
+    """Classify the latest price position against the Bollinger Bands"""
+    signal = 'HOLD'
+    strength = 0
+    reason = ''
+    
+    # Check for bounces off bands
+    if current_price <= bb_lower and prev_price > bb_lower:
+        signal = 'BUY'
+        strength = ((bb_lower - current_price) / bb_lower) * 100
+        reason = f'Bollinger Bands: Price touched lower band at {bb_lower:.2f}'
+    elif current_price >= bb_upper and prev_price < bb_upper:
+        signal = 'SELL'
+        strength = ((current_price - bb_upper) / bb_upper) * 100
+        reason = f'Bollinger Bands: Price touched upper band at {bb_upper:.2f}'
+    elif current_price <= bb_lower:
+        signal = 'HOLD_OVERSOLD'
+        strength = ((bb_lower - current_price) / bb_lower) * 100
+        reason = f'Bollinger Bands: Price below lower band (oversold)'
+    elif current_price >= bb_upper:
+        signal = 'HOLD_OVERBOUGHT'
+        strength = ((current_price - bb_upper) / bb_upper) * 100
+        reason = f'Bollinger Bands: Price above upper band (overbought)'
+    else:
+        signal = 'HOLD_NEUTRAL'
+        strength = 0
+        reason = f'Bollinger Bands: Price between bands'
+    
+    return {
+        'signal': signal,
+        'strength': round(strength, 2),
+        'reason': reason,
+        'current_price': current_price,
+        'bb_upper': round(bb_upper, 2),
+        'bb_middle': round(bb_middle, 2),
+        'bb_lower': round(bb_lower, 2),
+        'strategy': 'Bollinger Bands'
+    }
+
 
 class RealTimeSignalGenerator:
     def __init__(self):
-        self.signals_history = {}
-        self.last_signals = {}
+        self.signals_history = deque(maxlen=_SIGNALS_HISTORY_SIZE)  # (symbol, overall_signal, confidence, timestamp)
+        self.last_signals: Dict[str, Tuple[str, float]] = {}  # symbol -> (overall_signal, confidence)
+        self._streams: Dict[str, StreamingIndicators] = {}
+        # Per-bar result cache: the streaming state evaluates each indicator once per bar and
+        # the composite is reused until the bar changes, so indicators need no cache of their own
+        self._composite_cache: Dict[str, Tuple[Tuple, Dict]] = {}  # symbol -> (bar key, result)
         
     def calculate_sma_signals(self, data: pd.DataFrame, short_window=20, long_window=50) -> Dict:
         """Calculate Simple Moving Average signals"""
         if len(data) < long_window:
             return {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
         
-        # Calculate moving averages
-        data['SMA_short'] = data['Close'].rolling(window=short_window).mean()
-        data['SMA_long'] = data['Close'].rolling(window=long_window).mean()
+        close = data['Close'].to_numpy(dtype=np.float64)
         
-        # Get latest values
-        latest = data.iloc[-1]
-        previous = data.iloc[-2] if len(data) > 1 else latest
+        # Only the last two full-window averages are needed for the crossover check
+        short_ma = close[-short_window:].mean()
+        long_ma = close[-long_window:].mean()
+        prev_short_ma = close[-short_window - 1:-1].mean() if len(close) > short_window else np.nan
+        prev_long_ma = close[-long_window - 1:-1].mean() if len(close) > long_window else np.nan
         
-        current_price = latest['Close']
-        short_ma = latest['SMA_short']
-        long_ma = latest['SMA_long']
-        prev_short_ma = previous['SMA_short']
-        prev_long_ma = previous['SMA_long']
-        
-        # Determine signal
-        signal = 'HOLD'
-        strength = 0
-        reason = ''
-        
-        # Check for crossover
-        if short_ma > long_ma and prev_short_ma <= prev_long_ma:
-            signal = 'BUY'
-            strength = min(((short_ma - long_ma) / long_ma) * 100, 100)
-            reason = f'SMA crossover: {short_window}-day MA crossed above {long_window}-day MA'
-        elif short_ma < long_ma and prev_short_ma >= prev_long_ma:
-            signal = 'SELL'
-            strength = min(((long_ma - short_ma) / long_ma) * 100, 100)
-            reason = f'SMA crossover: {short_window}-day MA crossed below {long_window}-day MA'
-        elif short_ma > long_ma:
-            signal = 'HOLD_BULLISH'
-            strength = min(((short_ma - long_ma) / long_ma) * 100, 100)
-            reason = f'Bullish trend: {short_window}-day MA above {long_window}-day MA'
-        else:
-            signal = 'HOLD_BEARISH'
-            strength = min(((long_ma - short_ma) / long_ma) * 100, 100)
-            reason = f'Bearish trend: {short_window}-day MA below {long_window}-day MA'
-        
-        return {
-            'signal': signal,
-            'strength': round(strength, 2),
-            'reason': reason,
-            'current_price': current_price,
-            'short_ma': round(short_ma, 2),
-            'long_ma': round(long_ma, 2),
-            'strategy': 'SMA'
-        }
+        return _sma_signal(close[-1], short_ma, long_ma, prev_short_ma, prev_long_ma, short_window, long_window)
     
     def calculate_rsi_signals(self, data: pd.DataFrame, period=14, oversold=30, overbought=70) -> Dict:
         """Calculate RSI signals"""
         if len(data) < period + 1:
             return {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
         
-        # Calculate RSI
-        data['RSI'] = TechnicalIndicators.rsi(data['Close'], period=period)
-        
-        latest = data.iloc[-1]
-        previous = data.iloc[-2] if len(data) > 1 else latest
+        rsi = TechnicalIndicators.rsi(data['Close'], period=period).to_numpy()
+        close = data['Close'].to_numpy(dtype=np.float64)
         
-        current_rsi = latest['RSI']
-        prev_rsi = previous['RSI']
-        current_price = latest['Close']
-        
-        signal = 'HOLD'
-        strength = 0
-        reason = ''
-        
-        if current_rsi <= oversold and prev_rsi > oversold:
-            signal = 'BUY'
-            strength = (oversold - current_rsi) / oversold * 100
-            reason = f'RSI oversold: {current_rsi:.1f} (threshold: {oversold})'
-        elif current_rsi >= overbought and prev_rsi < overbought:
-            signal = 'SELL'
-            strength = (current_rsi - overbought) / (100 - overbought) * 100
-            reason = f'RSI overbought: {current_rsi:.1f} (threshold: {overbought})'
-        elif current_rsi <= oversold:
-            signal = 'HOLD_OVERSOLD'
-            strength = (oversold - current_rsi) / oversold * 100
-            reason = f'RSI oversold territory: {current_rsi:.1f}'
-        elif current_rsi >= overbought:
-            signal = 'HOLD_OVERBOUGHT'
-            strength = (current_rsi - overbought) / (100 - overbought) * 100
-            reason = f'RSI overbought territory: {current_rsi:.1f}'
-        else:
-            signal = 'HOLD_NEUTRAL'
-            strength = 0
-            reason = f'RSI neutral: {current_rsi:.1f}'
-        
-        return {
-            'signal': signal,
-            'strength': round(strength, 2),
-            'reason': reason,
-            'current_price': current_price,
-            'rsi': round(current_rsi, 2),
-            'strategy': 'RSI'
-        }
+        return _rsi_signal(close[-1], rsi[-1], rsi[-2], oversold, overbought)
     
     def calculate_macd_signals(self, data: pd.DataFrame, fast=12, slow=26, signal_period=9) -> Dict:
         """Calculate MACD signals"""
         if len(data) < slow + signal_period:
             return {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
         
-        # Calculate MACD
         macd_line, signal_line, histogram = TechnicalIndicators.macd(data['Close'], fast=fast, slow=slow, signal=signal_period)
-        data['MACD'] = macd_line
-        data['MACD_signal'] = signal_line
-        data['MACD_histogram'] = histogram
-        
-        latest = data.iloc[-1]
-        previous = data.iloc[-2] if len(data) > 1 else latest
-        
-        current_macd = latest['MACD']
-        current_signal = latest['MACD_signal']
-        current_histogram = latest['MACD_histogram']
-        prev_macd = previous['MACD']
-        prev_signal = previous['MACD_signal']
-        current_price = latest['Close']
+        macd_line = macd_line.to_numpy()
+        signal_line = signal_line.to_numpy()
+        close = data['Close'].to_numpy(dtype=np.float64)
         
-        signal = 'HOLD'
-        strength = 0
-        reason = ''
-        
-        # Check for signal line crossover
-        if current_macd > current_signal and prev_macd <= prev_signal:
-            signal = 'BUY'
-            strength = min(abs(current_macd - current_signal) * 100, 100)
-            reason = 'MACD bullish crossover: MACD line crossed above signal line'
-        elif current_macd < current_signal and prev_macd >= prev_signal:
-            signal = 'SELL'
-            strength = min(abs(current_macd - current_signal) * 100, 100)
-            reason = 'MACD bearish crossover: MACD line crossed below signal line'
-        elif current_macd > current_signal:
-            signal = 'HOLD_BULLISH'
-            strength = min(abs(current_macd - current_signal) * 100, 100)
-            reason = 'MACD bullish: MACD line above signal line'
-        else:
-            signal = 'HOLD_BEARISH'
-            strength = min(abs(current_macd - current_signal) * 100, 100)
-            reason = 'MACD bearish: MACD line below signal line'
-        
-        return {
-            'signal': signal,
-            'strength': round(strength, 2),
-            'reason': reason,
-            'current_price': current_price,
-            'macd': round(current_macd, 4),
-            'macd_signal': round(current_signal, 4),
-            'macd_histogram': round(current_histogram, 4),
-            'strategy': 'MACD'
-        }
+        return _macd_signal(close[-1], macd_line[-1], signal_line[-1], histogram.iloc[-1],
+                            macd_line[-2], signal_line[-2])
     
     def calculate_bollinger_bands_signals(self, data: pd.DataFrame, period=20, std_dev=2) -> Dict:
         """Calculate Bollinger Bands signals"""
         if len(data) < period:
             return {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
         
-        # Calculate Bollinger Bands
         bb_upper, bb_middle, bb_lower = TechnicalIndicators.bollinger_bands(data['Close'], period=period, std_dev=std_dev)
-        data['BB_upper'] = bb_upper
-        data['BB_middle'] = bb_middle
-        data['BB_lower'] = bb_lower
-        
-        latest = data.iloc[-1]
-        previous = data.iloc[-2] if len(data) > 1 else latest
+        close = data['Close'].to_numpy(dtype=np.float64)
+        prev_price = close[-2] if len(close) > 1 else close[-1]
         
-        current_price = latest['Close']
-        prev_price = previous['Close']
-        bb_upper = latest['BB_upper']
-        bb_middle = latest['BB_middle']
-        bb_lower = latest['BB_lower']
+        return _bb_signal(close[-1], prev_price, bb_upper.iloc[-1], bb_middle.iloc[-1], bb_lower.iloc[-1])
+    
+    def _sync_stream(self, symbol: str, data: pd.DataFrame) -> StreamingIndicators:
+        """
+        Bring the symbol's streaming state up to date with data
+        
+        Every row except the last is treated as a finished bar and committed once;
+        the last row may still be forming and is only peeked at. If the last
+        committed bar is no longer in data, the state is rebuilt from scratch.
+        """
+        index = data.index
+        stream = self._streams.get(symbol)
+        
+        start = 0
+        if stream is not None and stream.last_timestamp is not None and stream.last_timestamp in index:
+            start = index.get_loc(stream.last_timestamp) + 1
+        closes = data['Close'].to_numpy(dtype=np.float64)
+        if stream is None or start == 0 or start >= len(data):
+            stream = StreamingIndicators()
+            self._streams[symbol] = stream
+            if len(data) > 1:
+                stream.seed(closes[:-1], index[-2])
+            return stream
+        
+        for i in range(start, len(data) - 1):
+            stream.push(float(closes[i]), index[i])
+        
+        return stream
+    
+    def generate_composite_signal(self, symbol: str, data: pd.DataFrame, now: Optional[datetime] = None) -> Dict:
+        """
+        Generate composite signal from multiple strategies
         
-        signal = 'HOLD'
-        strength = 0
-        reason = ''
+        now is used as the signal timestamp, so callers handling several symbols
+        can sample the clock once; it defaults to datetime.now().
+        """
+        signals = []
+        n = len(data)
+        
+        # Polls often return the same bars again; reuse the result until the last bar changes.
+        # The close is part of the key because the last bar is still forming.
+        closes = data['Close'].to_numpy()
+        bar_key = (n, data.index[-1], closes[-1])
+        cached = self._composite_cache.get(symbol)
+        if cached is not None and cached[0] == bar_key:
+            # Hand out a copy stamped with this call's time, not the shared cached dict
+            return {**cached[1], 'timestamp': now if now is not None else datetime.now()}
+        
+        # Only the newest bar is evaluated here; everything before it is already in the streaming state
+        stream = self._sync_stream(symbol, data)
+        latest = stream.peek(float(closes[-1]))
+        previous = stream.current if stream.current is not None else latest
+        current_price = latest['close']
+        
+        if n < stream.long_window:
+            sma_signal = {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
+        else:
+            sma_signal = _sma_signal(current_price, latest['short_ma'], latest['long_ma'],
+                                     previous['short_ma'], previous['long_ma'],
+                                     stream.short_window, stream.long_window)
         
-        # Check for bounces off bands
-        if current_price <= bb_lower and prev_price > bb_lower:
-            signal = 'BUY'
-            strength = ((bb_lower - current_price) / bb_lower) * 100
-            reason = f'Bollinger Bands: Price touched lower band at {bb_lower:.2f}'
-        elif current_price >= bb_upper and prev_price < bb_upper:
-            signal = 'SELL'
-            strength = ((current_price - bb_upper) / bb_upper) * 100
-            reason = f'Bollinger Bands: Price touched upper band at {bb_upper:.2f}'
-        elif current_price <= bb_lower:
-            signal = 'HOLD_OVERSOLD'
-            strength = ((bb_lower - current_price) / bb_lower) * 100
-            reason = f'Bollinger Bands: Price below lower band (oversold)'
-        elif current_price >= bb_upper:
-            signal = 'HOLD_OVERBOUGHT'
-            strength = ((current_price - bb_upper) / bb_upper) * 100
-            reason = f'Bollinger Bands: Price above upper band (overbought)'
+        if n < stream.rsi_period + 1:
+            rsi_signal = {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
         else:
-            signal = 'HOLD_NEUTRAL'
-            strength = 0
-            reason = f'Bollinger Bands: Price between bands'
+            rsi_signal = _rsi_signal(current_price, latest['rsi'], previous['rsi'])
         
-        return {
-            'signal': signal,
-            'strength': round(strength, 2),
-            'reason': reason,
-            'current_price': current_price,
-            'bb_upper': round(bb_upper, 2),
-            'bb_middle': round(bb_middle, 2),
-            'bb_lower': round(bb_lower, 2),
-            'strategy': 'Bollinger Bands'
-        }
-    
-    def generate_composite_signal(self, symbol: str, data: pd.DataFrame) -> Dict:
-        """Generate composite signal from multiple strategies"""
-        signals = []
+        if n < stream.macd_slow + stream.macd_signal:
+            macd_signal = {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
+        else:
+            macd_signal = _macd_signal(current_price, latest['macd'], latest['macd_signal'],
+                                       latest['macd_histogram'], previous['macd'], previous['macd_signal'])
         
-        # Get signals from all strategies
-        sma_signal = self.calculate_sma_signals(data)
-        rsi_signal = self.calculate_rsi_signals(data)
-        macd_signal = self.calculate_macd_signals(data)
-        bb_signal = self.calculate_bollinger_bands_signals(data)
+        if n < stream.bb_period:
+            bb_signal = {'signal': 'HOLD', 'strength': 0, 'reason': 'Insufficient data'}
+        else:
+            bb_upper = latest['bb_middle'] + latest['bb_std'] * 2
+            bb_lower = latest['bb_middle'] - latest['bb_std'] * 2
+            bb_signal = _bb_signal(current_price, previous['close'], bb_upper, latest['bb_middle'], bb_lower)
         
         signals.extend([sma_signal, rsi_signal, macd_signal, bb_signal])
         
-        # Calculate composite signal
-        buy_votes = sum(1 for s in signals if s['signal'] in ['BUY'])
-        sell_votes = sum(1 for s in signals if s['signal'] in ['SELL'])
-        bullish_votes = sum(1 for s in signals if s['signal'] in ['BUY', 'HOLD_BULLISH'])
-        bearish_votes = sum(1 for s in signals if s['signal'] in ['SELL', 'HOLD_BEARISH'])
+        # Calculate composite signal from one count per signal state
+        ids = np.fromiter((_SIG_IDS[s['signal']] for s in signals), dtype=np.int64, count=len(signals))
+        counts = np.bincount(ids, minlength=len(Sig))
+        buy_votes = int(counts[Sig.BUY])
+        sell_votes = int(counts[Sig.SELL])
+        bullish_votes = buy_votes + int(counts[Sig.HOLD_BULLISH])
+        bearish_votes = sell_votes + int(counts[Sig.HOLD_BEARISH])
         
         # Determine overall signal
         overall_signal = 'HOLD'
@@ -262,34 +345,38 @@ class RealTimeSignalGenerator:
             overall_signal = 'WEAK_SELL'
             confidence = 30
         
-        return {
+        result = {
             'symbol': symbol,
             'overall_signal': overall_signal,
             'confidence': round(confidence, 1),
-            'timestamp': datetime.now(),
+            'timestamp': now if now is not None else datetime.now(),
             'individual_signals': signals,
             'buy_votes': buy_votes,
             'sell_votes': sell_votes,
             'bullish_votes': bullish_votes,
             'bearish_votes': bearish_votes
         }
+        self._composite_cache[symbol] = (bar_key, result)
+        return result
+    
+    def forget_symbol(self, symbol: str):
+        """Drop all per-symbol state, e.g. when a symbol is no longer monitored"""
+        self.last_signals.pop(symbol, None)
+        self._streams.pop(symbol, None)
+        self._composite_cache.pop(symbol, None)
     
     def should_alert(self, symbol: str, new_signal: Dict) -> bool:
         """Check if we should send an alert for this signal"""
-        if symbol not in self.last_signals:
-            self.last_signals[symbol] = new_signal
-            return True
-        
-        last_signal = self.last_signals[symbol]
-        
-        # Alert if signal changed
-        if last_signal['overall_signal'] != new_signal['overall_signal']:
-            self.last_signals[symbol] = new_signal
-            return True
-        
-        # Alert if confidence changed significantly
-        if abs(last_signal['confidence'] - new_signal['confidence']) >= 20:
-            self.last_signals[symbol] = new_signal
-            return True
-        
-        return False
\ No newline at end of file
+        overall_signal = new_signal['overall_signal']
+        confidence = new_signal['confidence']
+        last = self.last_signals.get(symbol)
+        
+        # Alert on the first signal, when the signal changed, or when confidence changed significantly
+        if last is not None:
+            last_signal, last_confidence = last
+            if last_signal == overall_signal and abs(last_confidence - confidence) < 20:
+                return False
+        
+        self.last_signals[symbol] = (overall_signal, confidence)
+        self.signals_history.append((symbol, overall_signal, confidence, new_signal.get('timestamp')))
+        return True
\ No newline at end of file
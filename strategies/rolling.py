@@ -0,0 +1,86 @@
+from collections import deque
+from typing import Iterable
+
+
+class RollingSum:
+    """
+    Fixed-size window with a running sum, updated in O(1) per value
+    
+    The sum is advanced as total += x - evicted, the same arithmetic the fused
+    seeding kernels use, so a window loaded from a kernel's running sum keeps
+    producing identical values. The batch counterparts over whole arrays are the
+    Numba kernels in custom_indicators (_rolling_mean_nb and friends).
+    """
+    __slots__ = ('window', 'total', '_values')
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.total = 0.0
+        self._values = deque(maxlen=window)
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.window
+    
+    def evicted(self) -> float:
+        """Value that pushing onto a full window would drop, 0.0 otherwise"""
+        return self._values[0] if len(self._values) == self.window else 0.0
+    
+    def peek(self, x: float) -> float:
+        """Sum of the window if x were pushed, without pushing it"""
+        return self.total + x - self.evicted()
+    
+    def push(self, x: float) -> float:
+        """Append x, dropping the oldest value once the window is full; returns the new sum"""
+        self.total += x - self.evicted()
+        self._values.append(x)
+        return self.total
+    
+    def load(self, values: Iterable[float], total: float):
+        """Restore the window from its trailing values and a running sum computed elsewhere"""
+        self._values.clear()
+        self._values.extend(values)
+        self.total = total
+
+
+class RollingExtreme:
+    """
+    Running max (or min) over a fixed-size window using a monotonic deque
+    
+    Each value enters and leaves the deque at most once, so push is amortized
+    O(1). Candidates are kept as (position, value) with values decreasing from
+    the front for a max (increasing for a min), so the front is always the extreme.
+    """
+    __slots__ = ('window', 'is_max', 'count', '_candidates')
+    
+    def __init__(self, window: int, is_max: bool = True):
+        self.window = window
+        self.is_max = is_max
+        self.count = 0
+        self._candidates = deque()
+    
+    @property
+    def value(self) -> float:
+        """Extreme of the current window, NaN when empty"""
+        return self._candidates[0][1] if self._candidates else float('nan')
+    
+    def push(self, x: float) -> float:
+        """Append x and return the extreme of the window ending at it (NaNs are skipped)"""
+        candidates = self._candidates
+        if x == x:
+            if self.is_max:
+                while candidates and candidates[-1][1] <= x:
+                    candidates.pop()
+            else:
+                while candidates and candidates[-1][1] >= x:
+                    candidates.pop()
+            candidates.append((self.count, x))
+        self.count += 1
+        
+        # Drop the front once it falls out of the window
+        while candidates and candidates[0][0] <= self.count - 1 - self.window:
+            candidates.popleft()
+        return self.value
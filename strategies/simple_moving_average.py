@@ -1,7 +1,104 @@
 import pandas as pd
 import numpy as np
+from numba import njit, types
 from typing import Tuple, Dict
 
+_F64_IN = types.Array(types.float64, 1, 'A', readonly=True)
+
+_SIGNAL_COLUMNS = ['price', 'short_mavg', 'long_mavg', 'signal', 'positions']
+
+
+@njit(types.float64[:, ::1](_F64_IN, types.int64, types.int64), cache=True)
+def _sma_crossover_nb(close, short_window, long_window):
+    """
+    Short/long moving averages, crossover signal and positions in one pass
+    
+    The averages use min_periods=1 and skip NaNs, like rolling().mean(). The
+    signal is 1.0 where the short average is above the long one, from bar
+    short_window on, and positions is its first difference (NaN on the first bar).
+    
+    Returns:
+    np.ndarray: (5, n) block with rows price, short_mavg, long_mavg, signal, positions
+    """
+    n = close.shape[0]
+    out = np.empty((5, n))
+    out[0] = close
+    short_mavg = out[1]
+    long_mavg = out[2]
+    signal = out[3]
+    positions = out[4]
+    signal[:] = 0.0
+    
+    short_sum = 0.0
+    long_sum = 0.0
+    short_count = 0
+    long_count = 0
+    for i in range(n):
+        v = close[i]
+        if not np.isnan(v):
+            short_sum += v
+            short_count += 1
+            long_sum += v
+            long_count += 1
+        if i >= short_window and not np.isnan(close[i - short_window]):
+            short_sum -= close[i - short_window]
+            short_count -= 1
+        if i >= long_window and not np.isnan(close[i - long_window]):
+            long_sum -= close[i - long_window]
+            long_count -= 1
+        
+        short_mavg[i] = short_sum / short_count if short_count > 0 else np.nan
+        long_mavg[i] = long_sum / long_count if long_count > 0 else np.nan
+        
+        if i >= short_window and short_mavg[i] > long_mavg[i]:
+            signal[i] = 1.0
+        positions[i] = signal[i] - signal[i - 1] if i > 0 else np.nan
+    
+    return out
+
+
+@njit(types.UniTuple(types.float64[:], 4)(_F64_IN, _F64_IN), cache=True)
+def _returns_nb(close, signal):
+    """
+    Stock/strategy returns and their cumulative products in one pass
+    
+    Matches pct_change(fill_method=None), a one-bar-lagged signal and
+    cumprod(), which leaves NaN at missing returns and carries the product past them.
+    
+    Returns:
+    tuple: (stock_returns, strategy_returns, cumulative_stock_returns, cumulative_strategy_returns)
+    """
+    n = close.shape[0]
+    stock_ret = np.empty(n)
+    strat_ret = np.empty(n)
+    cum_stock = np.empty(n)
+    cum_strat = np.empty(n)
+    
+    stock_prod = 1.0
+    strat_prod = 1.0
+    for i in range(n):
+        if i == 0:
+            stock_ret[i] = np.nan
+            strat_ret[i] = np.nan
+        else:
+            stock_ret[i] = close[i] / close[i - 1] - 1.0
+            strat_ret[i] = stock_ret[i] * signal[i - 1]
+        
+        if np.isnan(stock_ret[i]):
+            cum_stock[i] = np.nan
+        else:
+            stock_prod *= 1.0 + stock_ret[i]
+            cum_stock[i] = stock_prod
+        
+        if np.isnan(strat_ret[i]):
+            cum_strat[i] = np.nan
+        else:
+            strat_prod *= 1.0 + strat_ret[i]
+            cum_strat[i] = strat_prod
+    
+    return stock_ret, strat_ret, cum_stock, cum_strat
+
+
 class SimpleMovingAverageStrategy:
     def __init__(self, short_window=20, long_window=50):
         self.short_window = short_window
@@ -19,22 +116,11 @@ class SimpleMovingAverageStrategy:
         Returns:
         pd.DataFrame: DataFrame with signals and positions
         """
-        signals = pd.DataFrame(index=data.index)
-        signals['price'] = data['Close']
-        
-        # Calculate moving averages
-        signals['short_mavg'] = data['Close'].rolling(window=self.short_window, min_periods=1).mean()
-        signals['long_mavg'] = data['Close'].rolling(window=self.long_window, min_periods=1).mean()
-        
-        # Generate signals
-        signals['signal'] = 0.0
-        signals['signal'][self.short_window:] = np.where(
-            signals['short_mavg'][self.short_window:] > signals['long_mavg'][self.short_window:], 
-            1.0, 0.0
-        )
+        # Moving averages, signals and positions come from a single pass over Close
+        block = _sma_crossover_nb(data['Close'].to_numpy(dtype=np.float64), self.short_window, self.long_window)
         
-        # Generate positions
-        signals['positions'] = signals['signal'].diff()
+        # The kernel fills pandas' column-major block layout, so the frame wraps it without a copy
+        signals = pd.DataFrame(block.T, index=data.index, columns=_SIGNAL_COLUMNS, copy=False)
         
         self.signals = signals
         return signals
@@ -49,12 +135,13 @@ class SimpleMovingAverageStrategy:
         if self.signals is None:
             return {"buy": [], "sell": []}
         
-        buy_signals = self.signals[self.signals['positions'] == 1.0]
-        sell_signals = self.signals[self.signals['positions'] == -1.0]
+        # Only the trade dates are needed, so index the dates directly
+        positions = self.signals['positions'].to_numpy()
+        index = self.signals.index
         
         return {
-            "buy": buy_signals.index.tolist(),
-            "sell": sell_signals.index.tolist()
+            "buy": index[np.flatnonzero(positions == 1.0)].tolist(),
+            "sell": index[np.flatnonzero(positions == -1.0)].tolist()
         }
     
     def calculate_returns(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -70,10 +157,18 @@ class SimpleMovingAverageStrategy:
         if self.signals is None:
             self.generate_signals(data)
         
-        returns = pd.DataFrame(index=data.index)
-        returns['stock_returns'] = data['Close'].pct_change()
-        returns['strategy_returns'] = returns['stock_returns'] * self.signals['signal'].shift(1)
-        returns['cumulative_stock_returns'] = (1 + returns['stock_returns']).cumprod()
-        returns['cumulative_strategy_returns'] = (1 + returns['strategy_returns']).cumprod()
+        signal = self.signals['signal']
+        if not signal.index.equals(data.index):
+            signal = signal.reindex(data.index)
+        
+        stock_ret, strat_ret, cum_stock, cum_strat = _returns_nb(
+            data['Close'].to_numpy(dtype=np.float64), signal.to_numpy(dtype=np.float64))
+        
+        returns = pd.DataFrame({
+            'stock_returns': stock_ret,
+            'strategy_returns': strat_ret,
+            'cumulative_stock_returns': cum_stock,
+            'cumulative_strategy_returns': cum_strat
+        }, index=data.index)
         
         return returns
\ No newline at end of file
@@ -0,0 +1,334 @@
+import numpy as np
+from collections import deque
+from numba import njit, types
+from typing import Dict
+from .rolling import RollingSum
+
+
+# Kernels are compiled at import from their explicit signatures and cached on disk
+_F64_IN = types.Array(types.float64, 1, 'A', readonly=True)
+
+
+def _ewm_step(prev, x, alpha):
+    """One adjust=False EWM update, evaluated in the same order as pandas"""
+    if prev != prev:  # No observation yet
+        return x
+    if prev == x:
+        return x
+    old_wt = 1.0 - alpha
+    return (old_wt * prev + alpha * x) / (old_wt + alpha)
+
+
+_ewm_step_nb = njit(types.float64(types.float64, types.float64, types.float64), cache=True)(_ewm_step)
+
+
+def _wilder_step(i, delta, gain_sum, loss_sum, avg_gain, avg_loss, period):
+    """
+    Advance Wilder's RSI averages by bar i, whose change from the previous close is delta
+    
+    The first period changes are summed and averaged; after that each bar is folded
+    in with avg = (avg * (period - 1) + x) / period.
+    
+    Returns:
+    tuple: (gain_sum, loss_sum, avg_gain, avg_loss)
+    """
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    if i <= 0:
+        return gain_sum, loss_sum, avg_gain, avg_loss
+    if i < period:
+        return gain_sum + gain, loss_sum + loss, avg_gain, avg_loss
+    if i == period:
+        gain_sum += gain
+        loss_sum += loss
+        return gain_sum, loss_sum, gain_sum / period, loss_sum / period
+    return gain_sum, loss_sum, (avg_gain * (period - 1) + gain) / period, (avg_loss * (period - 1) + loss) / period
+
+
+def _rsi_value(avg_gain, avg_loss):
+    """RSI from Wilder's averages; NaN before the first full period"""
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0:
+        return 100.0
+    return np.nan
+
+
+_wilder_step_nb = njit(types.UniTuple(types.float64, 4)(types.int64, types.float64, types.float64, types.float64,
+                                                        types.float64, types.float64, types.int64),
+                       cache=True)(_wilder_step)
+_rsi_value_nb = njit(types.float64(types.float64, types.float64), cache=True)(_rsi_value)
+
+
+@njit(types.Tuple((types.float64[:], types.float64[:]))(
+          _F64_IN, types.int64, types.int64, types.int64, types.float64, types.float64, types.float64, types.int64),
+      cache=True)
+def _seed_nb(close, short_window, long_window, rsi_period, fast_alpha, slow_alpha, signal_alpha, bb_period):
+    """
+    Fused single pass over close producing the full streaming state
+    
+    Every indicator is advanced in the same loop, so close is read once instead of
+    once per indicator. The arithmetic mirrors StreamingIndicators.push step for
+    step, so seeding and pushing bar by bar give identical state.
+    
+    Returns:
+    tuple: (state, values) where state holds the running sums/EWM terms and values
+           the indicators as of the last bar
+    """
+    n = close.shape[0]
+    state = np.zeros(11)
+    values = np.full(7, np.nan)
+    sma_short_sum = 0.0
+    sma_long_sum = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    avg_gain = np.nan
+    avg_loss = np.nan
+    ema_fast = np.nan
+    ema_slow = np.nan
+    signal_ema = np.nan
+    bb_sum = 0.0
+    bb_sumsq = 0.0
+    shift = close[0] if n > 0 else 0.0
+    
+    for i in range(n):
+        x = close[i]
+        
+        delta = x - close[i - 1] if i > 0 else 0.0
+        gain_sum, loss_sum, avg_gain, avg_loss = _wilder_step_nb(
+            i, delta, gain_sum, loss_sum, avg_gain, avg_loss, rsi_period)
+        
+        old_short = close[i - short_window] if i >= short_window else 0.0
+        old_long = close[i - long_window] if i >= long_window else 0.0
+        d = x - shift
+        old_bb = close[i - bb_period] - shift if i >= bb_period else 0.0
+        
+        ema_fast = _ewm_step_nb(ema_fast, x, fast_alpha)
+        ema_slow = _ewm_step_nb(ema_slow, x, slow_alpha)
+        macd = ema_fast - ema_slow
+        signal_ema = _ewm_step_nb(signal_ema, macd, signal_alpha)
+        
+        if i == n - 1:
+            if i + 1 >= short_window:
+                values[0] = (sma_short_sum + x - old_short) / short_window
+            if i + 1 >= long_window:
+                values[1] = (sma_long_sum + x - old_long) / long_window
+            values[2] = _rsi_value_nb(avg_gain, avg_loss)
+            values[3] = macd
+            values[4] = signal_ema
+            s = bb_sum + d - old_bb
+            sq = bb_sumsq + d * d - old_bb * old_bb
+            count = min(i + 1, bb_period)
+            values[5] = shift + s / count
+            if count > 1:
+                var = (sq - s * s / count) / (count - 1)
+                values[6] = np.sqrt(var) if var > 0.0 else 0.0
+        
+        sma_short_sum += x - old_short
+        sma_long_sum += x - old_long
+        bb_sum += d - old_bb
+        bb_sumsq += d * d - old_bb * old_bb
+    
+    state[0] = sma_short_sum
+    state[1] = sma_long_sum
+    state[2] = gain_sum
+    state[3] = loss_sum
+    state[4] = avg_gain
+    state[5] = avg_loss
+    state[6] = ema_fast
+    state[7] = ema_slow
+    state[8] = signal_ema
+    state[9] = bb_sum
+    state[10] = bb_sumsq
+    return state, values
+
+
+class StreamingIndicators:
+    """
+    Incremental indicator state for a single symbol
+    
+    Each committed bar updates running sums and EMA recurrences in O(1), so the
+    latest SMA/RSI/MACD/Bollinger values never require rescanning the history.
+    The definitions match TechnicalIndicators: rolling means over full windows for
+    the SMAs, Wilder-smoothed RSI, Bollinger bands with min_periods=1, and
+    the adjust=False EWM recurrence for MACD.
+    """
+    
+    def __init__(self, short_window=20, long_window=50, rsi_period=14,
+                 macd_fast=12, macd_slow=26, macd_signal=9, bb_period=20):
+        self.short_window = short_window
+        self.long_window = long_window
+        self.rsi_period = rsi_period
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal = macd_signal
+        self.bb_period = bb_period
+        
+        self.count = 0
+        self.last_close = np.nan
+        self.last_timestamp = None
+        self.current = None  # Indicator values as of the last committed bar
+        
+        # SMA windows
+        self._short_sma = RollingSum(short_window)
+        self._long_sma = RollingSum(long_window)
+        
+        # Wilder RSI: gain/loss sums over the first period, then the smoothed averages
+        self.rsi_gain_sum = 0.0
+        self.rsi_loss_sum = 0.0
+        self.rsi_avg_gain = np.nan
+        self.rsi_avg_loss = np.nan
+        
+        # EMA recurrences (adjust=False), NaN until the first bar
+        self._fast_alpha = 1.0 / (1.0 + (macd_fast - 1.0) / 2.0)
+        self._slow_alpha = 1.0 / (1.0 + (macd_slow - 1.0) / 2.0)
+        self._signal_alpha = 1.0 / (1.0 + (macd_signal - 1.0) / 2.0)
+        self.ema_fast = np.nan
+        self.ema_slow = np.nan
+        self.macd_signal_ema = np.nan
+        
+        # Bollinger window, accumulated around the first close to keep the variance stable
+        self._bb_win = deque(maxlen=bb_period)
+        self._bb_shift = None
+        self.bb_sum = 0.0
+        self.bb_sumsq = 0.0
+    
+    def seed(self, closes: np.ndarray, timestamp=None) -> Dict:
+        """
+        Initialise the state from a block of finished bars in one fused pass
+        
+        Parameters:
+        closes (np.ndarray): Close prices of the finished bars, oldest first
+        timestamp: Timestamp of the last bar in closes
+        
+        Returns:
+        dict: Indicator values as of the last bar
+        """
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        if closes.size == 0:
+            return self.current
+        
+        state, values = _seed_nb(closes, self.short_window, self.long_window, self.rsi_period,
+                                 self._fast_alpha, self._slow_alpha, self._signal_alpha, self.bb_period)
+        (sma_short_sum, sma_long_sum, self.rsi_gain_sum, self.rsi_loss_sum,
+         self.rsi_avg_gain, self.rsi_avg_loss, self.ema_fast, self.ema_slow, self.macd_signal_ema,
+         self.bb_sum, self.bb_sumsq) = state.tolist()
+        
+        # The windows only need their trailing values
+        self._short_sma.load(closes[-self.short_window:].tolist(), sma_short_sum)
+        self._long_sma.load(closes[-self.long_window:].tolist(), sma_long_sum)
+        self._bb_win.extend(closes[-self.bb_period:].tolist())
+        self._bb_shift = float(closes[0])
+        
+        short_ma, long_ma, rsi, macd, macd_signal, bb_middle, bb_std = values.tolist()
+        self.count = int(closes.size)
+        self.last_close = float(closes[-1])
+        self.last_timestamp = timestamp
+        self.current = {
+            'close': self.last_close,
+            'short_ma': short_ma,
+            'long_ma': long_ma,
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_histogram': macd - macd_signal,
+            'bb_middle': bb_middle,
+            'bb_std': bb_std
+        }
+        return self.current
+    
+    def _rsi_step(self, close: float):
+        """Wilder RSI state after appending close, without committing it"""
+        delta = close - self.last_close if self.count > 0 else 0.0
+        return _wilder_step(self.count, delta, self.rsi_gain_sum, self.rsi_loss_sum,
+                            self.rsi_avg_gain, self.rsi_avg_loss, self.rsi_period)
+    
+    def peek(self, close: float) -> Dict:
+        """
+        Indicator values if close were appended as the next bar, without committing it
+        
+        Parameters:
+        close (float): Close price of the provisional bar
+        
+        Returns:
+        dict: Latest indicator values
+        """
+        n = self.count + 1
+        
+        # SMAs need a full window
+        short_ma = np.nan
+        if n >= self.short_window:
+            short_ma = self._short_sma.peek(close) / self.short_window
+        long_ma = np.nan
+        if n >= self.long_window:
+            long_ma = self._long_sma.peek(close) / self.long_window
+        
+        # RSI from Wilder's smoothed averages
+        _, _, avg_gain, avg_loss = self._rsi_step(close)
+        rsi = _rsi_value(avg_gain, avg_loss)
+        
+        # MACD
+        macd = _ewm_step(self.ema_fast, close, self._fast_alpha) - _ewm_step(self.ema_slow, close, self._slow_alpha)
+        macd_signal = _ewm_step(self.macd_signal_ema, macd, self._signal_alpha)
+        
+        # Bollinger Bands
+        shift = close if self._bb_shift is None else self._bb_shift
+        d = close - shift
+        evicted = self._bb_win[0] - shift if len(self._bb_win) == self.bb_period else 0.0
+        bb_sum = self.bb_sum + d - evicted
+        bb_sumsq = self.bb_sumsq + d * d - evicted * evicted
+        bb_count = min(n, self.bb_period)
+        bb_middle = shift + bb_sum / bb_count
+        if bb_count > 1:
+            var = (bb_sumsq - bb_sum * bb_sum / bb_count) / (bb_count - 1)
+            bb_std = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            bb_std = np.nan
+        
+        return {
+            'close': close,
+            'short_ma': short_ma,
+            'long_ma': long_ma,
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_histogram': macd - macd_signal,
+            'bb_middle': bb_middle,
+            'bb_std': bb_std
+        }
+    
+    def push(self, close: float, timestamp=None) -> Dict:
+        """
+        Commit a finished bar
+        
+        Parameters:
+        close (float): Close price of the bar
+        timestamp: Bar timestamp, used to resume from the right row of later data
+        
+        Returns:
+        dict: Indicator values as of this bar
+        """
+        values = self.peek(close)
+        
+        self._short_sma.push(close)
+        self._long_sma.push(close)
+        
+        self.rsi_gain_sum, self.rsi_loss_sum, self.rsi_avg_gain, self.rsi_avg_loss = self._rsi_step(close)
+        
+        self.ema_fast = _ewm_step(self.ema_fast, close, self._fast_alpha)
+        self.ema_slow = _ewm_step(self.ema_slow, close, self._slow_alpha)
+        self.macd_signal_ema = _ewm_step(self.macd_signal_ema, values['macd'], self._signal_alpha)
+        
+        if self._bb_shift is None:
+            self._bb_shift = close
+        d = close - self._bb_shift
+        evicted = self._bb_win[0] - self._bb_shift if len(self._bb_win) == self.bb_period else 0.0
+        self.bb_sum += d - evicted
+        self.bb_sumsq += d * d - evicted * evicted
+        self._bb_win.append(close)
+        
+        self.count += 1
+        self.last_close = close
+        self.last_timestamp = timestamp
+        self.current = values
+        return values
@@ -1,11 +1,62 @@
 import yfinance as yf
 import pandas as pd
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+# How long fetched bars stay fresh, by interval (seconds)
+_INTRADAY_TTL = 60.0
+_DAILY_TTL = 3600.0
+_INTRADAY_INTERVALS = {'1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h'}
+# Most (symbol, period, interval) results kept; least recently used are evicted first
+_CACHE_SIZE = 256
+# Ticker metadata (price, market cap, ...) is refetched once per this many seconds
+_INFO_TTL = 3600
+
+
+@lru_cache(maxsize=256)
+def _get_info_cached(symbol, bucket):
+    """Ticker metadata, memoized per symbol and time bucket (errors propagate and are not cached)"""
+    return yf.Ticker(symbol).info
+
 
 class DataFetcher:
+    # (symbol, period, interval) -> (fetch time, data), shared by all fetchers and kept in LRU order
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()  # Fetches run on worker threads
+    
     def __init__(self):
         self.data = None
     
+    @staticmethod
+    def _ttl(interval):
+        return _INTRADAY_TTL if interval in _INTRADAY_INTERVALS else _DAILY_TTL
+    
+    def _cached(self, symbol, period, interval):
+        """Fresh cached data for the request, or None; an expired entry is dropped"""
+        key = (symbol, period, interval)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self._ttl(interval):
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return entry[1].copy()
+    
+    def _store(self, symbol, period, interval, data):
+        key = (symbol, period, interval)
+        entry = (time.monotonic(), data.copy())
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
     def fetch_data(self, symbol, period="1y", interval="1d"):
         """
         Fetch stock data from Yahoo Finance
@@ -18,9 +69,16 @@ class DataFetcher:
         Returns:
         pd.DataFrame: Stock data with OHLCV columns
         """
+        data = self._cached(symbol, period, interval)
+        if data is not None:
+            self.data = data
+            return data
+        
         try:
             ticker = yf.Ticker(symbol)
             data = ticker.history(period=period, interval=interval)
+            if not data.empty:
+                self._store(symbol, period, interval, data)
             self.data = data
             return data
         except Exception as e:
@@ -39,16 +97,46 @@ class DataFetcher:
         Returns:
         dict: Dictionary with symbol as key and DataFrame as value
         """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        
         data_dict = {}
         for symbol in symbols:
-            data_dict[symbol] = self.fetch_data(symbol, period, interval)
-        return data_dict
+            data = self._cached(symbol, period, interval)
+            if data is not None:
+                data_dict[symbol] = data
+        pending = [symbol for symbol in dict.fromkeys(symbols) if symbol not in data_dict]
+        
+        # One batched request for all tickers; fall back to parallel per-symbol fetches if it fails
+        if pending:
+            try:
+                raw = yf.download(pending, period=period, interval=interval, group_by='ticker',
+                                  auto_adjust=True, actions=True, threads=True, progress=False)
+                fetched = set(raw.columns.get_level_values(0))
+                for symbol in pending:
+                    if symbol in fetched:
+                        data = raw[symbol].dropna(how='all')
+                        if not data.empty:
+                            self._store(symbol, period, interval, data)
+                            data_dict[symbol] = data
+            except Exception as e:
+                print(f"Batch download failed, fetching symbols individually: {e}")
+        
+        # Tickers the batch returned nothing for are retried one by one
+        missing = [symbol for symbol in pending if symbol not in data_dict]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(16, len(missing))) as pool:
+                for symbol, data in zip(missing, pool.map(lambda s: self.fetch_data(s, period, interval), missing)):
+                    data_dict[symbol] = data
+        
+        self.data = data_dict[symbols[-1]]
+        return {symbol: data_dict[symbol] for symbol in symbols}
     
     def get_info(self, symbol):
         """Get stock information"""
         try:
-            ticker = yf.Ticker(symbol)
-            return ticker.info
+            return _get_info_cached(symbol, int(time.time() // _INFO_TTL))
         except Exception as e:
             print(f"Error getting info for {symbol}: {e}")
             return None
\ No newline at end of file
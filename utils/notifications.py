@@ -1,23 +1,125 @@
 import os
 import platform
+import queue
 import subprocess
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
-import json
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Optional, Union
+import orjson
+
+_SYSTEM = platform.system()
+
+# Fixed notification scripts; title and message are passed as arguments, never spliced into the source
+_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts')
+_OSASCRIPT_NOTIFY = os.path.join(_SCRIPTS_DIR, 'notify.applescript')
+_POWERSHELL_NOTIFY = os.path.join(_SCRIPTS_DIR, 'notify.ps1')
+
+# Native notification/sound bindings are optional; without them the platform's
+# command-line tools are launched instead
+try:
+    import gi
+    gi.require_version('Notify', '0.7')
+    from gi.repository import Notify
+except (ImportError, ValueError):
+    Notify = None
+
+try:
+    from AppKit import NSSound
+except ImportError:
+    NSSound = None
+
+_MAC_SOUNDS = {
+    'buy': "/System/Library/Sounds/Glass.aiff",  # High pitch sound for buy
+    'sell': "/System/Library/Sounds/Sosumi.aiff",  # Low pitch sound for sell
+    'neutral': "/System/Library/Sounds/Ping.aiff"
+}
+
+
+# Console color codes
+_COLORS = MappingProxyType({
+    'STRONG_BUY': '\\033[92m',  # Green
+    'BUY': '\\033[92m',
+    'WEAK_BUY': '\\033[93m',   # Yellow
+    'HOLD': '\\033[94m',       # Blue
+    'WEAK_SELL': '\\033[93m',
+    'SELL': '\\033[91m',       # Red
+    'STRONG_SELL': '\\033[91m',
+    'RESET': '\\033[0m'
+})
+_RESET = _COLORS['RESET']
+_SIG_LINE_TEMPLATE = "  {color}• {strategy}: {signal_type} ({strength:.1f}%){reset}\n    Reason: {reason}"
+
+
+def _json_default(obj):
+    """orjson fallback for datetime subclasses such as pd.Timestamp"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _sound_kind(signal_type: str) -> str:
+    if signal_type in ['STRONG_BUY', 'BUY']:
+        return 'buy'
+    if signal_type in ['STRONG_SELL', 'SELL']:
+        return 'sell'
+    return 'neutral'
+
+
+@dataclass(slots=True, frozen=True)
+class Alert:
+    """Position entry/exit alert, expanded into signal-data form only when it is sent"""
+    symbol: str
+    signal: str
+    confidence: float
+    timestamp: datetime
+    reason: str
+    price: float
+    shares: int
+    stop: Optional[float] = None
+    target: Optional[float] = None
+    
+    def as_signal_data(self) -> Dict:
+        """Expand into the signal-data dict layout used by the alert formatters"""
+        return {
+            'symbol': self.symbol,
+            'overall_signal': self.signal,
+            'confidence': self.confidence,
+            'timestamp': self.timestamp,
+            'individual_signals': [{
+                'strategy': 'Risk Management',
+                'signal': 'SELL' if self.signal == 'POSITION_EXITED' else 'BUY',
+                'strength': 100,
+                'current_price': self.price,
+                'reason': self.reason
+            }]
+        }
+
 
 class NotificationSystem:
     def __init__(self, enable_sound=True, enable_desktop=True, enable_console=True):
         self.enable_sound = enable_sound
         self.enable_desktop = enable_desktop
         self.enable_console = enable_console
-        self.alert_history = []
+        self.alert_history = deque(maxlen=100)  # Oldest alerts fall off automatically
+        self._notification = None  # libnotify notification, reused for every alert
+        self._sounds = {}  # Preloaded NSSound objects by sound kind
+        
+        # Desktop notifications and sounds are dispatched off the caller's thread
+        self._dispatch_queue = queue.Queue()
+        self._dispatch_worker = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatch_worker.start()
         
-    def send_alert(self, signal_data: Dict):
+    def send_alert(self, signal_data: Union[Dict, Alert]):
         """Send trading alert through multiple channels"""
+        if isinstance(signal_data, Alert):
+            signal_data = signal_data.as_signal_data()
+        
         symbol = signal_data.get('symbol', 'Unknown')
         overall_signal = signal_data.get('overall_signal', 'HOLD')
-        confidence = signal_data.get('confidence', 0)
-        timestamp = signal_data.get('timestamp', datetime.now())
         
         # Format alert message
         title = f"Trading Alert: {symbol}"
@@ -28,23 +130,70 @@ class NotificationSystem:
             self._console_alert(signal_data)
         
         if self.enable_desktop:
-            self._desktop_notification(title, message)
+            self._dispatch_queue.put((self._desktop_notification, (title, message)))
         
         if self.enable_sound:
-            self._sound_alert(overall_signal)
+            self._dispatch_queue.put((self._sound_alert, (overall_signal,)))
         
         # Store in history
+        self._record_alert(signal_data, message)
+    
+    def send_alerts_bulk(self, alerts: List[Union[Dict, Alert]]):
+        """
+        Send a batch of trading alerts
+        
+        Every alert is printed and recorded, but the batch shares a single
+        desktop notification and a single sound instead of one per alert.
+        
+        Parameters:
+        alerts (list): Signal data dicts or Alert objects, oldest first
+        """
+        if not alerts:
+            return
+        alerts = [a.as_signal_data() if isinstance(a, Alert) else a for a in alerts]
+        if len(alerts) == 1:
+            self.send_alert(alerts[0])
+            return
+        
+        messages = []
+        for signal_data in alerts:
+            message = self._format_alert_message(signal_data)
+            messages.append(message.split('\\n', 1)[0])
+            
+            if self.enable_console:
+                self._console_alert(signal_data)
+            
+            self._record_alert(signal_data, message)
+        
+        if self.enable_desktop:
+            self._dispatch_queue.put((self._desktop_notification,
+                                      (f"Trading Alerts: {len(alerts)} signals", '\\n'.join(messages))))
+        
+        if self.enable_sound:
+            self._dispatch_queue.put((self._sound_alert, (alerts[-1].get('overall_signal', 'HOLD'),)))
+    
+    def _dispatch_loop(self):
+        """Run queued desktop/sound notifications one at a time"""
+        while True:
+            func, args = self._dispatch_queue.get()
+            try:
+                func(*args)
+            finally:
+                self._dispatch_queue.task_done()
+    
+    def wait_for_dispatch(self):
+        """Block until every queued desktop/sound notification has been sent"""
+        self._dispatch_queue.join()
+    
+    def _record_alert(self, signal_data: Dict, message: str):
+        """Append an alert to the history, keeping only the last 100"""
         self.alert_history.append({
-            'timestamp': timestamp,
-            'symbol': symbol,
-            'signal': overall_signal,
-            'confidence': confidence,
+            'timestamp': signal_data.get('timestamp') or datetime.now(),
+            'symbol': signal_data.get('symbol', 'Unknown'),
+            'signal': signal_data.get('overall_signal', 'HOLD'),
+            'confidence': signal_data.get('confidence', 0),
             'message': message
         })
-        
-        # Keep only last 100 alerts
-        if len(self.alert_history) > 100:
-            self.alert_history = self.alert_history[-100:]
     
     def _format_alert_message(self, signal_data: Dict) -> str:
         """Format the alert message"""
@@ -78,74 +227,62 @@ class NotificationSystem:
         symbol = signal_data.get('symbol', 'Unknown')
         overall_signal = signal_data.get('overall_signal', 'HOLD')
         confidence = signal_data.get('confidence', 0)
-        timestamp = signal_data.get('timestamp', datetime.now())
+        timestamp = signal_data.get('timestamp') or datetime.now()
         individual_signals = signal_data.get('individual_signals', [])
         
-        # Color codes
-        colors = {
-            'STRONG_BUY': '\\033[92m',  # Green
-            'BUY': '\\033[92m',
-            'WEAK_BUY': '\\033[93m',   # Yellow
-            'HOLD': '\\033[94m',       # Blue
-            'WEAK_SELL': '\\033[93m',
-            'SELL': '\\033[91m',       # Red
-            'STRONG_SELL': '\\033[91m',
-            'RESET': '\\033[0m'
-        }
+        color = _COLORS.get(overall_signal, _RESET)
         
-        color = colors.get(overall_signal, colors['RESET'])
-        
-        print("\\n" + "="*60)
-        print(f"{color}🚨 TRADING ALERT: {symbol}{colors['RESET']}")
-        print(f"⏰ Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{color}📊 Signal: {overall_signal} (Confidence: {confidence}%){colors['RESET']}")
+        lines = [
+            "\\n" + "="*60,
+            f"{color}🚨 TRADING ALERT: {symbol}{_RESET}",
+            f"⏰ Time: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"{color}📊 Signal: {overall_signal} (Confidence: {confidence}%){_RESET}"
+        ]
         
         if individual_signals:
             current_price = individual_signals[0].get('current_price', 0)
             if current_price > 0:
-                print(f"💰 Current Price: ${current_price:.2f}")
+                lines.append(f"💰 Current Price: ${current_price:.2f}")
         
-        print("\\n📈 Strategy Breakdown:")
+        lines.append("\\n📈 Strategy Breakdown:")
         for signal in individual_signals:
-            strategy = signal.get('strategy', 'Unknown')
             signal_type = signal.get('signal', 'HOLD')
-            strength = signal.get('strength', 0)
-            reason = signal.get('reason', 'No reason provided')
-            
-            signal_color = colors.get(signal_type.split('_')[0], colors['RESET'])
-            print(f"  {signal_color}• {strategy}: {signal_type} ({strength:.1f}%){colors['RESET']}")
-            print(f"    Reason: {reason}")
+            lines.append(_SIG_LINE_TEMPLATE.format_map({
+                'color': _COLORS.get(signal_type.split('_')[0], _RESET),
+                'strategy': signal.get('strategy', 'Unknown'),
+                'signal_type': signal_type,
+                'strength': signal.get('strength', 0),
+                'reason': signal.get('reason', 'No reason provided'),
+                'reset': _RESET
+            }))
         
-        print("="*60)
+        lines.append("="*60)
+        print("\n".join(lines))
     
     def _desktop_notification(self, title: str, message: str):
         """Send desktop notification"""
         try:
-            system = platform.system()
+            system = _SYSTEM
             
             if system == "Darwin":  # macOS
                 # Use osascript for macOS notifications
-                script = f'''
-                display notification "{message}" with title "{title}" sound name "default"
-                '''
-                subprocess.run(["osascript", "-e", script], check=False)
+                subprocess.Popen(["osascript", _OSASCRIPT_NOTIFY, title, message])
                 
             elif system == "Linux":
-                # Use notify-send for Linux
-                subprocess.run(["notify-send", title, message], check=False)
+                # Talk to the notification daemon directly when libnotify is available
+                if Notify is not None and (Notify.is_initted() or Notify.init("algo-trade")):
+                    if self._notification is None:
+                        self._notification = Notify.Notification.new(title, message)
+                    else:
+                        self._notification.update(title, message)
+                    self._notification.show()
+                else:
+                    subprocess.Popen(["notify-send", title, message])
                 
             elif system == "Windows":
                 # Use PowerShell for Windows
-                script = f'''
-                Add-Type -AssemblyName System.Windows.Forms
-                $notification = New-Object System.Windows.Forms.NotifyIcon
-                $notification.Icon = [System.Drawing.SystemIcons]::Information
-                $notification.BalloonTipTitle = "{title}"
-                $notification.BalloonTipText = "{message}"
-                $notification.Visible = $true
-                $notification.ShowBalloonTip(5000)
-                '''
-                subprocess.run(["powershell", "-Command", script], check=False)
+                subprocess.Popen(["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
+                                  "-File", _POWERSHELL_NOTIFY, title, message])
                 
         except Exception as e:
             print(f"❌ Desktop notification failed: {e}")
@@ -153,34 +290,36 @@ class NotificationSystem:
     def _sound_alert(self, signal_type: str):
         """Play sound alert"""
         try:
-            system = platform.system()
+            system = _SYSTEM
+            kind = _sound_kind(signal_type)
             
             if system == "Darwin":  # macOS
-                if signal_type in ['STRONG_BUY', 'BUY']:
-                    # High pitch sound for buy
-                    subprocess.run(["afplay", "/System/Library/Sounds/Glass.aiff"], check=False)
-                elif signal_type in ['STRONG_SELL', 'SELL']:
-                    # Low pitch sound for sell
-                    subprocess.run(["afplay", "/System/Library/Sounds/Sosumi.aiff"], check=False)
+                if NSSound is not None:
+                    # Load each sound once and replay it in-process
+                    sound = self._sounds.get(kind)
+                    if sound is None:
+                        sound = NSSound.alloc().initWithContentsOfFile_byReference_(_MAC_SOUNDS[kind], True)
+                        self._sounds[kind] = sound
+                    sound.stop()
+                    sound.play()
                 else:
-                    # Neutral sound
-                    subprocess.run(["afplay", "/System/Library/Sounds/Ping.aiff"], check=False)
+                    subprocess.Popen(["afplay", _MAC_SOUNDS[kind]])
                     
             elif system == "Linux":
                 # Use beep command or speaker-test
-                if signal_type in ['STRONG_BUY', 'BUY']:
-                    subprocess.run(["beep", "-f", "1000", "-l", "200"], check=False)
-                elif signal_type in ['STRONG_SELL', 'SELL']:
-                    subprocess.run(["beep", "-f", "400", "-l", "200"], check=False)
+                if kind == 'buy':
+                    subprocess.Popen(["beep", "-f", "1000", "-l", "200"])
+                elif kind == 'sell':
+                    subprocess.Popen(["beep", "-f", "400", "-l", "200"])
                 else:
-                    subprocess.run(["beep", "-f", "700", "-l", "100"], check=False)
+                    subprocess.Popen(["beep", "-f", "700", "-l", "100"])
                     
             elif system == "Windows":
                 # Use winsound
                 import winsound
-                if signal_type in ['STRONG_BUY', 'BUY']:
+                if kind == 'buy':
                     winsound.Beep(1000, 200)
-                elif signal_type in ['STRONG_SELL', 'SELL']:
+                elif kind == 'sell':
                     winsound.Beep(400, 200)
                 else:
                     winsound.Beep(700, 100)
@@ -190,7 +329,7 @@ class NotificationSystem:
     
     def get_alert_history(self, limit: int = 10) -> List[Dict]:
         """Get recent alert history"""
-        return self.alert_history[-limit:]
+        return list(islice(self.alert_history, max(0, len(self.alert_history) - limit), None))
     
     def clear_alert_history(self):
         """Clear alert history"""
@@ -203,16 +342,11 @@ class NotificationSystem:
             filename = f"alert_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         try:
-            # Convert datetime objects to strings for JSON serialization
-            history_json = []
-            for alert in self.alert_history:
-                alert_copy = alert.copy()
-                if isinstance(alert_copy['timestamp'], datetime):
-                    alert_copy['timestamp'] = alert_copy['timestamp'].isoformat()
-                history_json.append(alert_copy)
-            
-            with open(filename, 'w') as f:
-                json.dump(history_json, f, indent=2)
+            # orjson encodes datetimes and NumPy scalars itself, so the records are serialized as they are
+            payload = orjson.dumps(list(self.alert_history), default=_json_default,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            with open(filename, 'wb') as f:
+                f.write(payload)
             
             print(f"💾 Alert history saved to {filename}")
             return filename
@@ -241,4 +375,5 @@ class NotificationSystem:
         
         print("🧪 Testing notification system...")
         self.send_alert(test_signal)
+        self.wait_for_dispatch()
         print("✅ Test notification sent")
\ No newline at end of file
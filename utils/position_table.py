@@ -0,0 +1,75 @@
+import numpy as np
+from typing import Dict, List
+
+_FLOAT_FIELDS = ('entry_price', 'position_value', 'stop_loss_price', 'take_profit_price', 'risk_amount')
+_FIELDS = ('shares', 'entry_ns') + _FLOAT_FIELDS
+
+
+class PositionTable:
+    """
+    Open positions stored column-wise
+    
+    Each numeric field lives in its own preallocated array, with rows kept packed
+    in [0, n) so portfolio-wide sums and checks are single contiguous scans.
+    Removing a position moves the last row into its slot; row order is therefore
+    not entry order.
+    """
+    __slots__ = ('n', 'symbols', 'index') + _FIELDS
+    
+    def __init__(self, capacity: int = 64):
+        self.n = 0
+        self.symbols: List[str] = []
+        self.index: Dict[str, int] = {}  # Symbol -> row
+        self.shares = np.zeros(capacity, dtype=np.int64)
+        self.entry_ns = np.zeros(capacity, dtype=np.int64)  # Entry time, epoch nanoseconds
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.index
+    
+    def _grow(self):
+        capacity = max(1, 2 * self.shares.size)
+        for name in _FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+    
+    def add(self, symbol: str, position_info: Dict, entry_ns: int) -> int:
+        """Append a position from its position-info dict and entry time, and return its row"""
+        if self.n == self.shares.size:
+            self._grow()
+        i = self.n
+        self.shares[i] = position_info['shares']
+        self.entry_ns[i] = entry_ns
+        for name in _FLOAT_FIELDS:
+            getattr(self, name)[i] = position_info.get(name, 0.0)
+        self.symbols.append(symbol)
+        self.index[symbol] = i
+        self.n += 1
+        return i
+    
+    def remove(self, symbol: str):
+        """Drop a position, moving the last row into its slot"""
+        i = self.index.pop(symbol)
+        last = self.n - 1
+        if i != last:
+            for name in _FIELDS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+            moved = self.symbols[last]
+            self.symbols[i] = moved
+            self.index[moved] = i
+        self.symbols.pop()
+        self.n = last
+    
+    def row_to_dict(self, i: int) -> Dict:
+        """Numeric fields of row i as a dict"""
+        row = {'symbol': self.symbols[i], 'shares': int(self.shares[i]), 'entry_ns': int(self.entry_ns[i])}
+        for name in _FLOAT_FIELDS:
+            row[name] = float(getattr(self, name)[i])
+        return row
@@ -2,15 +2,26 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import time
+import asyncio
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List, Callable, Optional
+from .ring_buffer import OHLCVRing
+
+_BAR_SECONDS = 60  # Monitoring uses 1-minute bars
+_INCREMENTAL_MAX_AGE = 24 * 3600  # Newest cached bar must be this recent for a 1d top-up to close the gap
 
 class RealTimeDataFetcher:
-    def __init__(self, update_interval=60):
+    def __init__(self, update_interval=60, max_concurrency=8, callback_workers=1):
         self.update_interval = update_interval  # seconds
+        self.max_concurrency = max_concurrency  # symbols fetched at the same time
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='fetch')
+        # Callbacks run off the polling loop; with more than one worker they must be thread-safe
+        self.callback_workers = callback_workers
+        self._cb_pool = None
         self.symbols = []
-        self.data_cache = {}
+        self.data_cache: Dict[str, OHLCVRing] = {}  # Per-symbol bar history
         self.callbacks = []
         self.is_running = False
         self.thread = None
@@ -20,7 +31,7 @@ class RealTimeDataFetcher:
         """Add a symbol to monitor"""
         if symbol not in self.symbols:
             self.symbols.append(symbol)
-            self.data_cache[symbol] = pd.DataFrame()
+            self.data_cache[symbol] = OHLCVRing()
             print(f"📊 Added {symbol} to monitoring list")
     
     def remove_symbol(self, symbol: str):
@@ -34,6 +45,12 @@ class RealTimeDataFetcher:
         """Add a callback function to be called when data is updated"""
         self.callbacks.append(callback)
     
+    def _callback_pool(self) -> ThreadPoolExecutor:
+        """Executor the callbacks are dispatched to, created on first use"""
+        if self._cb_pool is None:
+            self._cb_pool = ThreadPoolExecutor(max_workers=self.callback_workers, thread_name_prefix='callback')
+        return self._cb_pool
+    
     def get_current_data(self, symbol: str, period="5d", interval="1m") -> pd.DataFrame:
         """Get current data for a symbol"""
         try:
@@ -44,57 +61,118 @@ class RealTimeDataFetcher:
             print(f"❌ Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
     
-    def get_latest_price(self, symbol: str) -> Dict:
-        """Get the latest price and basic info for a symbol"""
+    def get_latest_price(self, symbol: str, data: Optional[pd.DataFrame] = None) -> Dict:
+        """
+        Get the latest price and basic info for a symbol
+        
+        Parameters:
+        symbol (str): Stock symbol
+        data (pd.DataFrame): Already fetched intraday bars to read from; fetched if omitted
+        
+        Returns:
+        dict: Latest price, change, volume and OHLC of the newest bar
+        """
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            # Get latest price data
-            data = ticker.history(period="1d", interval="1m")
+            if data is None:
+                data = yf.Ticker(symbol).history(period="1d", interval="1m")
             if data.empty:
                 return {}
             
-            latest = data.iloc[-1]
-            previous = data.iloc[-2] if len(data) > 1 else latest
+            # Read scalars straight from the column arrays rather than building row Series
+            close = data['Close'].to_numpy()
+            price = close[-1]
+            prev_close = close[-2] if len(close) > 1 else price
             
             return {
                 'symbol': symbol,
-                'price': latest['Close'],
-                'change': latest['Close'] - previous['Close'],
-                'change_percent': ((latest['Close'] - previous['Close']) / previous['Close']) * 100,
-                'volume': latest['Volume'],
-                'timestamp': latest.name,
-                'high': latest['High'],
-                'low': latest['Low'],
-                'open': latest['Open']
+                'price': price,
+                'change': price - prev_close,
+                'change_percent': ((price - prev_close) / prev_close) * 100,
+                'volume': data['Volume'].to_numpy()[-1],
+                'timestamp': data.index[-1],
+                'high': data['High'].to_numpy()[-1],
+                'low': data['Low'].to_numpy()[-1],
+                'open': data['Open'].to_numpy()[-1]
             }
         except Exception as e:
             print(f"❌ Error getting latest price for {symbol}: {e}")
             return {}
     
+    def _fetch_period(self, symbol: str, t: float) -> Optional[str]:
+        """
+        History period to request for a symbol, or None to skip it this round
+        
+        The full 5d window is only fetched to fill an empty or stale cache; otherwise
+        the last day is enough to top it up. Nothing is fetched while the newest
+        cached bar is still forming and was already fetched within the current bar.
+        """
+        ring = self.data_cache.get(symbol)
+        last_bar = ring.last_timestamp if ring is not None else None
+        if last_bar is None:
+            return "5d"
+        
+        bar_age = t - last_bar / 1e9
+        last_update = self.last_update.get(symbol)
+        if (last_update is not None and bar_age < _BAR_SECONDS
+                and t - last_update.timestamp() < _BAR_SECONDS):
+            return None
+        return "1d" if bar_age < _INCREMENTAL_MAX_AGE else "5d"
+    
+    async def _fetch_symbol(self, symbol: str, period: Optional[str]):
+        """Fetch recent bars for one symbol without blocking the event loop"""
+        if period is None:
+            return None
+        # The fetcher's own pool bounds concurrency at max_concurrency requests in flight
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.get_current_data, symbol, period, "1m")
+    
+    async def _update_all(self):
+        """Fetch all monitored symbols concurrently, then dispatch the results in symbol order"""
+        symbols = list(self.symbols)
+        t = time.time()
+        periods = [self._fetch_period(symbol, t) for symbol in symbols]
+        results = await asyncio.gather(*(self._fetch_symbol(symbol, period)
+                                         for symbol, period in zip(symbols, periods)),
+                                       return_exceptions=True)
+        now = datetime.now()
+        pool = self._callback_pool()
+        futures = []
+        
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error updating data for {symbol}: {result}")
+                continue
+            
+            if result is None or result.empty or symbol not in self.data_cache:
+                continue
+            
+            # Merge the new bars into the cache and hand out the whole cached history;
+            # the latest price comes from the same bars, so one request per symbol suffices
+            ring = self.data_cache[symbol]
+            ring.update(result)
+            self.last_update[symbol] = now
+            data = ring.to_frame()
+            latest_info = self.get_latest_price(symbol, data=data)
+            
+            # Hand the updated data to every callback
+            for callback in self.callbacks:
+                futures.append((symbol, pool.submit(callback, symbol, data, latest_info)))
+        
+        if not futures:
+            return
+        
+        # Wait for the callbacks without blocking the loop, but never longer than half an interval
+        timeout = self.update_interval * 0.5
+        await asyncio.to_thread(wait, [future for _, future in futures], timeout)
+        for symbol, future in futures:
+            if not future.done():
+                print(f"⚠️ Callback for {symbol} still running after {timeout:g}s")
+            elif future.exception() is not None:
+                print(f"❌ Error in callback for {symbol}: {future.exception()}")
+    
     def update_data(self):
         """Update data for all monitored symbols"""
-        for symbol in self.symbols:
-            try:
-                # Get recent data
-                data = self.get_current_data(symbol, period="5d", interval="1m")
-                if not data.empty:
-                    self.data_cache[symbol] = data
-                    self.last_update[symbol] = datetime.now()
-                    
-                    # Get latest price info
-                    latest_info = self.get_latest_price(symbol)
-                    
-                    # Call all callbacks with updated data
-                    for callback in self.callbacks:
-                        try:
-                            callback(symbol, data, latest_info)
-                        except Exception as e:
-                            print(f"❌ Error in callback for {symbol}: {e}")
-                            
-            except Exception as e:
-                print(f"❌ Error updating data for {symbol}: {e}")
+        asyncio.run(self._update_all())
     
     def start_monitoring(self):
         """Start real-time monitoring"""
@@ -114,24 +192,33 @@ class RealTimeDataFetcher:
         self.is_running = False
         if self.thread:
             self.thread.join()
+        if self._cb_pool is not None:
+            self._cb_pool.shutdown(wait=False, cancel_futures=True)
+            self._cb_pool = None
         print("⏹️ Stopped real-time monitoring")
     
-    def _monitor_loop(self):
-        """Main monitoring loop"""
+    async def _poll_loop(self):
+        """Poll all symbols every update_interval seconds on one event loop"""
         while self.is_running:
             try:
                 print(f"🔄 Updating data at {datetime.now().strftime('%H:%M:%S')}")
-                self.update_data()
-                time.sleep(self.update_interval)
-            except KeyboardInterrupt:
-                break
+                await self._update_all()
+                await asyncio.sleep(self.update_interval)
             except Exception as e:
                 print(f"❌ Error in monitoring loop: {e}")
-                time.sleep(5)  # Wait before retrying
+                await asyncio.sleep(5)  # Wait before retrying
+    
+    def _monitor_loop(self):
+        """Main monitoring loop"""
+        try:
+            asyncio.run(self._poll_loop())
+        except KeyboardInterrupt:
+            pass
     
     def get_cached_data(self, symbol: str) -> pd.DataFrame:
         """Get cached data for a symbol"""
-        return self.data_cache.get(symbol, pd.DataFrame())
+        ring = self.data_cache.get(symbol)
+        return ring.to_frame() if ring is not None and len(ring) else pd.DataFrame()
     
     def get_status(self) -> Dict:
         """Get monitoring status"""
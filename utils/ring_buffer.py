@@ -0,0 +1,123 @@
+import pandas as pd
+import numpy as np
+from typing import Optional
+
+_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+
+class OHLCVRing:
+    """
+    Fixed-capacity OHLCV history for one symbol
+    
+    Bars are stored column-wise in preallocated float64 arrays with int64
+    nanosecond timestamps. Appending overwrites the oldest bar once the buffer
+    is full, so updates never reallocate or copy the history.
+    """
+    
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.timestamps = np.empty(capacity, dtype=np.int64)
+        self.columns = {name: np.empty(capacity, dtype=np.float64) for name in _COLUMNS}
+        self.n = 0
+        self.head = 0  # Slot the next bar is written to
+        self.tz = None
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Timestamp of the newest bar in nanoseconds, or None if empty"""
+        if self.n == 0:
+            return None
+        return int(self.timestamps[(self.head - 1) % self.capacity])
+    
+    def push(self, timestamp: int, open_: float, high: float, low: float, close: float, volume: float):
+        """Append a single bar"""
+        slot = self.head
+        self.timestamps[slot] = timestamp
+        for name, value in zip(_COLUMNS, (open_, high, low, close, volume)):
+            self.columns[name][slot] = value
+        self.head = (slot + 1) % self.capacity
+        self.n = min(self.n + 1, self.capacity)
+    
+    def update(self, data: pd.DataFrame) -> int:
+        """
+        Merge freshly fetched bars into the buffer
+        
+        The newest stored bar is overwritten if it appears again (it may still
+        have been forming when it was stored); only bars after it are appended.
+        
+        Parameters:
+        data (pd.DataFrame): OHLCV data with a DatetimeIndex, oldest first
+        
+        Returns:
+        int: Number of bars written
+        """
+        if data.empty:
+            return 0
+        
+        index = data.index
+        if self.tz is None:
+            self.tz = index.tz
+        ts = index.as_unit('ns').asi8
+        
+        start = 0
+        last = self.last_timestamp
+        if last is not None:
+            start = int(np.searchsorted(ts, last, side='left'))
+            if start < len(ts) and ts[start] == last:
+                # Rewind one slot so the stored copy of that bar is replaced
+                self.head = (self.head - 1) % self.capacity
+                self.n -= 1
+        
+        ts = ts[start:]
+        k = len(ts)
+        if k == 0:
+            return 0
+        
+        # Only the newest `capacity` bars can survive the write
+        skip = max(0, k - self.capacity)
+        values = {name: data[name].to_numpy(dtype=np.float64)[start + skip:] for name in _COLUMNS}
+        ts = ts[skip:]
+        k -= skip
+        
+        # Write in at most two contiguous chunks around the wrap point
+        first = min(k, self.capacity - self.head)
+        for dst, src in [(self.timestamps, ts)] + [(self.columns[name], values[name]) for name in _COLUMNS]:
+            dst[self.head:self.head + first] = src[:first]
+            dst[:k - first] = src[first:]
+        
+        self.head = (self.head + k) % self.capacity
+        self.n = min(self.n + k, self.capacity)
+        return k
+    
+    def _ordered(self, arr: np.ndarray) -> np.ndarray:
+        """Stored values of arr, oldest first"""
+        if self.n < self.capacity:
+            return arr[:self.n]
+        return np.concatenate((arr[self.head:], arr[:self.head]))
+    
+    def close_view(self) -> np.ndarray:
+        """Close prices, oldest first"""
+        return self._ordered(self.columns['Close'])
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Buffered history as an OHLCV DataFrame"""
+        index = pd.DatetimeIndex(self._ordered(self.timestamps).view('datetime64[ns]'))
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        
+        # Unwrap each column straight into one (columns, bars) block; its transpose is the
+        # layout pandas stores internally, so the frame wraps it without another copy and
+        # every column stays contiguous
+        block = np.empty((len(_COLUMNS), self.n))
+        tail = self.capacity - self.head if self.n == self.capacity else 0
+        for row, name in zip(block, _COLUMNS):
+            col = self.columns[name]
+            if tail:
+                row[:tail] = col[self.head:]
+                row[tail:] = col[:self.head]
+            else:
+                row[:] = col[:self.n]
+        return pd.DataFrame(block.T, index=index, columns=list(_COLUMNS), copy=False)
@@ -1,9 +1,108 @@
 import pandas as pd
 import numpy as np
+import time
+import logging
 from datetime import datetime, timedelta
+from enum import IntEnum
+from numba import njit, types
 from typing import Dict, List, Optional, Tuple
+from .position_table import PositionTable
+
+# Kernels are compiled eagerly from their explicit signatures and cached on disk;
+# inputs are declared read-only so table slices are accepted without a copy
+_F64_IN = types.Array(types.float64, 1, 'A', readonly=True)
+_I64_IN = types.Array(types.int64, 1, 'A', readonly=True)
+
+_DAY_NS = 86_400_000_000_000
+_MAX_HOLDING_DAYS = 30
+
+logger = logging.getLogger(__name__)
+
+# One row per closed trade; symbols and exit reasons are kept alongside in lists,
+# so neither is limited to a fixed width
+_TRADE_DTYPE = np.dtype([('entry_ns', 'i8'), ('exit_ns', 'i8'), ('shares', 'i8'),
+                         ('entry_px', 'f8'), ('exit_px', 'f8'), ('entry_value', 'f8'), ('pnl', 'f8')])
+
+
+@njit(types.float64(_I64_IN, _F64_IN, _F64_IN), cache=True)
+def _unrealized(shares, entry, price):
+    """Sum of shares * (price - entry) in one pass, without temporaries"""
+    total = 0.0
+    for i in range(shares.shape[0]):
+        total += shares[i] * (price[i] - entry[i])
+    return total
+
+
+class RejectReason(IntEnum):
+    """Outcome of the entry checks; OK means every check passed"""
+    OK = 0
+    SIGNAL_NOT_BUY = 1
+    ALREADY_IN_POSITION = 2
+    DAILY_LOSS_LIMIT = 3
+    PORTFOLIO_RISK = 4
+    LOW_CONFIDENCE = 5
+
+
+_REASON_FORMATS = {
+    RejectReason.OK: "All risk checks passed",
+    RejectReason.SIGNAL_NOT_BUY: "Signal is {}, not a buy signal",
+    RejectReason.ALREADY_IN_POSITION: "Already have position in {}",
+    RejectReason.DAILY_LOSS_LIMIT: "Daily loss limit reached ({:.1f}%)",
+    RejectReason.PORTFOLIO_RISK: "Portfolio risk limit reached ({:.1%})",
+    RejectReason.LOW_CONFIDENCE: "Signal confidence too low ({:.1f}% < {}%)",
+}
+
+
+def format_reason(code: RejectReason, args: tuple = ()) -> str:
+    """Human-readable message for an entry-check result as returned by RiskManager.check_entry"""
+    return _REASON_FORMATS[code].format(*args)
+
+
+@njit(types.boolean[::1](_F64_IN, _F64_IN, _F64_IN, _I64_IN, types.int64, types.int64), cache=True)
+def _exit_mask(price, stop_loss, take_profit, entry_ns, now_ns, max_hold_ns):
+    """Rows hitting stop loss, take profit or the holding limit, in one pass (NaN prices only hit the limit)"""
+    n = price.shape[0]
+    hit = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        p = price[i]
+        hit[i] = p <= stop_loss[i] or p >= take_profit[i] or now_ns - entry_ns[i] >= max_hold_ns
+    return hit
+
+
+def _to_datetime(ns: int) -> datetime:
+    """Local naive datetime for an epoch-nanosecond timestamp"""
+    return datetime.fromtimestamp(ns / 1e9)
+
+
+def _exit_record(symbol: str, shares: int, entry_price: float, exit_price: float, entry_value: float,
+                 pnl: float, reason: str, entry_ns: int, exit_ns: int) -> Dict:
+    """Exit record dict for one closed trade, as exit_position returns it"""
+    exit_value = shares * exit_price
+    return {
+        'symbol': symbol,
+        'shares': shares,
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'entry_value': entry_value,
+        'exit_value': exit_value,
+        'pnl': pnl,
+        'pnl_percent': (pnl / entry_value) * 100,
+        'reason': reason,
+        'entry_date': _to_datetime(entry_ns),
+        'exit_date': _to_datetime(exit_ns),
+        'holding_days': (exit_ns - entry_ns) // _DAY_NS
+    }
+
 
 class RiskManager:
+    __slots__ = ('max_position_size', '_max_daily_loss', 'max_portfolio_risk',
+                 '_stop_loss_percent', '_stop_loss_mul', '_take_profit_percent', '_take_profit_mul',
+                 '_buy_signals', '_sell_signals', 'min_entry_confidence',
+                 'portfolio_value', 'current_positions', 'table',
+                 '_sum_position_value', '_sum_risk_amount',
+                 'daily_pnl', '_daily_start_value', '_daily_loss_threshold_abs',
+                 '_trade_log', '_trade_n', '_trade_symbols', '_trade_reasons')
+    
     def __init__(self, 
                  max_position_size=0.1,  # 10% of portfolio per position
                  max_daily_loss=0.05,    # 5% max daily loss
@@ -12,15 +111,69 @@ class RiskManager:
                  max_portfolio_risk=0.2):   # 20% max portfolio risk
         
         self.max_position_size = max_position_size
-        self.max_daily_loss = max_daily_loss
+        self._max_daily_loss = max_daily_loss  # Threshold is derived once daily_start_value is set below
         self.stop_loss_percent = stop_loss_percent
         self.take_profit_percent = take_profit_percent
         self.max_portfolio_risk = max_portfolio_risk
         
+        self._buy_signals = frozenset({'BUY', 'STRONG_BUY'})
+        self._sell_signals = frozenset({'SELL', 'STRONG_SELL'})
+        self.min_entry_confidence = 60  # Minimum confidence for entry
+        
         self.portfolio_value = 10000  # Default starting value
-        self.current_positions = {}
+        self.current_positions = {}  # Full position-info dicts, for display and callers
+        self.table = PositionTable()  # Numeric fields of the same positions, column-wise
+        # Running totals over the open positions, kept in step with the table
+        self._sum_position_value = 0.0
+        self._sum_risk_amount = 0.0
         self.daily_pnl = 0
         self.daily_start_value = self.portfolio_value
+        # Closed trades, column-wise and grown by doubling; rows [0, _trade_n) are filled
+        self._trade_log = np.zeros(1024, dtype=_TRADE_DTYPE)
+        self._trade_n = 0
+        self._trade_symbols: List[str] = []
+        self._trade_reasons: List[str] = []
+    
+    @property
+    def daily_start_value(self) -> float:
+        """Portfolio value at the start of the day; setting it also moves the daily loss limit"""
+        return self._daily_start_value
+    
+    @daily_start_value.setter
+    def daily_start_value(self, value: float):
+        self._daily_start_value = value
+        # Daily P&L at or below this stops new entries
+        self._daily_loss_threshold_abs = -self._max_daily_loss * value
+    
+    @property
+    def max_daily_loss(self) -> float:
+        """Largest daily loss allowed, as a fraction of the start value; setting it also moves the limit"""
+        return self._max_daily_loss
+    
+    @max_daily_loss.setter
+    def max_daily_loss(self, value: float):
+        self._max_daily_loss = value
+        self._daily_loss_threshold_abs = -value * self._daily_start_value
+    
+    @property
+    def stop_loss_percent(self) -> float:
+        """Stop loss distance below entry; setting it also updates the stop price multiplier"""
+        return self._stop_loss_percent
+    
+    @stop_loss_percent.setter
+    def stop_loss_percent(self, value: float):
+        self._stop_loss_percent = value
+        self._stop_loss_mul = 1 - value
+    
+    @property
+    def take_profit_percent(self) -> float:
+        """Take profit distance above entry; setting it also updates the target price multiplier"""
+        return self._take_profit_percent
+    
+    @take_profit_percent.setter
+    def take_profit_percent(self, value: float):
+        self._take_profit_percent = value
+        self._take_profit_mul = 1 + value
         
     def calculate_position_size(self, symbol: str, entry_price: float, signal_strength: float = 1.0) -> Dict:
         """
@@ -34,19 +187,21 @@ class RiskManager:
         Returns:
         dict: Position sizing information
         """
+        portfolio_value = self.portfolio_value
+        
         # Base position size (percentage of portfolio)
         base_position_size = self.max_position_size * signal_strength
         
         # Calculate dollar amount
-        position_value = self.portfolio_value * base_position_size
+        position_value = portfolio_value * base_position_size
         
         # Calculate number of shares
         shares = int(position_value / entry_price)
         actual_position_value = shares * entry_price
         
         # Calculate stop loss and take profit levels
-        stop_loss_price = entry_price * (1 - self.stop_loss_percent)
-        take_profit_price = entry_price * (1 + self.take_profit_percent)
+        stop_loss_price = entry_price * self._stop_loss_mul
+        take_profit_price = entry_price * self._take_profit_mul
         
         # Calculate risk per share
         risk_per_share = entry_price - stop_loss_price
@@ -54,10 +209,11 @@ class RiskManager:
         
         # Check if position exceeds risk limits
         risk_warning = False
-        if total_risk > self.portfolio_value * self.max_daily_loss:
+        risk_cap = portfolio_value * self.max_daily_loss
+        if total_risk > risk_cap:
             risk_warning = True
             # Reduce position size to meet risk limit
-            max_shares = int((self.portfolio_value * self.max_daily_loss) / risk_per_share)
+            max_shares = int(risk_cap / risk_per_share)
             shares = min(shares, max_shares)
             actual_position_value = shares * entry_price
             total_risk = shares * risk_per_share
@@ -67,111 +223,242 @@ class RiskManager:
             'shares': shares,
             'entry_price': entry_price,
             'position_value': actual_position_value,
-            'position_percent': (actual_position_value / self.portfolio_value) * 100,
+            'position_percent': (actual_position_value / portfolio_value) * 100,
             'stop_loss_price': round(stop_loss_price, 2),
             'take_profit_price': round(take_profit_price, 2),
             'risk_amount': round(total_risk, 2),
-            'risk_percent': (total_risk / self.portfolio_value) * 100,
+            'risk_percent': (total_risk / portfolio_value) * 100,
             'risk_warning': risk_warning,
             'signal_strength': signal_strength
         }
     
-    def should_enter_position(self, symbol: str, signal_data: Dict) -> Tuple[bool, str]:
+    def calculate_position_sizes(self, symbols: List[str], entry_prices: np.ndarray,
+                                 signal_strengths: np.ndarray) -> Dict[str, Dict]:
         """
-        Determine if we should enter a position based on risk management rules
+        Calculate position sizes for many candidates at once
+        
+        Applies the same rules as calculate_position_size, evaluated over arrays.
+        
+        Parameters:
+        symbols (list): Stock symbols
+        entry_prices (np.ndarray): Proposed entry price per symbol
+        signal_strengths (np.ndarray): Signal strength (0-1) per symbol
         
         Returns:
-        tuple: (should_enter: bool, reason: str)
+        dict: Symbol -> position sizing information, as calculate_position_size returns it
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        signal_strengths = np.broadcast_to(np.asarray(signal_strengths, dtype=np.float64), entry_prices.shape)
+        
+        position_value = self.portfolio_value * (self.max_position_size * signal_strengths)
+        shares = (position_value / entry_prices).astype(np.int64)
+        stop_loss_price = entry_prices * self._stop_loss_mul
+        take_profit_price = entry_prices * self._take_profit_mul
+        risk_per_share = entry_prices - stop_loss_price
+        total_risk = shares * risk_per_share
+        
+        # Cap positions whose risk exceeds the daily loss limit
+        risk_cap = self.portfolio_value * self.max_daily_loss
+        risk_warning = total_risk > risk_cap
+        with np.errstate(divide='ignore', invalid='ignore'):
+            max_shares = np.where(risk_warning, risk_cap / risk_per_share, 0.0).astype(np.int64)
+        shares = np.where(risk_warning, np.minimum(shares, max_shares), shares)
+        actual_position_value = shares * entry_prices
+        total_risk = shares * risk_per_share
+        
+        # Round with Python's round() so prices match the scalar path to the cent
+        columns = zip(symbols, shares.tolist(), entry_prices.tolist(), actual_position_value.tolist(),
+                      (actual_position_value / self.portfolio_value * 100).tolist(),
+                      stop_loss_price.tolist(), take_profit_price.tolist(),
+                      total_risk.tolist(), (total_risk / self.portfolio_value * 100).tolist(),
+                      risk_warning.tolist(), signal_strengths.tolist())
+        return {
+            symbol: {
+                'symbol': symbol,
+                'shares': n_shares,
+                'entry_price': price,
+                'position_value': value,
+                'position_percent': value_pct,
+                'stop_loss_price': round(stop, 2),
+                'take_profit_price': round(target, 2),
+                'risk_amount': round(risk, 2),
+                'risk_percent': risk_pct,
+                'risk_warning': warning,
+                'signal_strength': strength
+            }
+            for (symbol, n_shares, price, value, value_pct, stop, target, risk, risk_pct, warning, strength) in columns
+        }
+    
+    def check_entry(self, symbol: str, signal_data: Dict) -> Tuple[RejectReason, tuple]:
+        """
+        Run the entry risk checks without formatting a message
+        
+        Returns:
+        tuple: (code: RejectReason, args: tuple); RejectReason.OK means enter, and
+               format_reason(code, args) gives the message should_enter_position returns
         """
         signal = signal_data.get('overall_signal', 'HOLD')
         confidence = signal_data.get('confidence', 0)
         
         # Don't enter if not a buy signal
-        if signal not in ['BUY', 'STRONG_BUY']:
-            return False, f"Signal is {signal}, not a buy signal"
+        if signal not in self._buy_signals:
+            return RejectReason.SIGNAL_NOT_BUY, (signal,)
         
         # Check if we already have a position
         if symbol in self.current_positions:
-            return False, f"Already have position in {symbol}"
+            return RejectReason.ALREADY_IN_POSITION, (symbol,)
         
         # Check daily loss limit
-        daily_loss_percent = (self.daily_pnl / self.daily_start_value) * 100
-        if daily_loss_percent <= -self.max_daily_loss * 100:
-            return False, f"Daily loss limit reached ({daily_loss_percent:.1f}%)"
+        if self.daily_pnl <= self._daily_loss_threshold_abs:
+            daily_loss_percent = (self.daily_pnl / self.daily_start_value) * 100
+            return RejectReason.DAILY_LOSS_LIMIT, (daily_loss_percent,)
         
         # Check portfolio risk
         current_risk = self.calculate_current_portfolio_risk()
         if current_risk >= self.max_portfolio_risk:
-            return False, f"Portfolio risk limit reached ({current_risk:.1%})"
+            return RejectReason.PORTFOLIO_RISK, (current_risk,)
         
         # Check signal confidence
-        min_confidence = 60  # Minimum confidence for entry
-        if confidence < min_confidence:
-            return False, f"Signal confidence too low ({confidence:.1f}% < {min_confidence}%)"
+        if confidence < self.min_entry_confidence:
+            return RejectReason.LOW_CONFIDENCE, (confidence, self.min_entry_confidence)
         
-        return True, "All risk checks passed"
+        return RejectReason.OK, ()
+    
+    def should_enter_position(self, symbol: str, signal_data: Dict) -> Tuple[bool, str]:
+        """
+        Determine if we should enter a position based on risk management rules
+        
+        Returns:
+        tuple: (should_enter: bool, reason: str)
+        """
+        code, args = self.check_entry(symbol, signal_data)
+        return code is RejectReason.OK, format_reason(code, args)
     
-    def should_exit_position(self, symbol: str, current_price: float, signal_data: Dict = None) -> Tuple[bool, str]:
+    def should_exit_position(self, symbol: str, current_price: float, signal_data: Dict = None,
+                             now_ns: int = None) -> Tuple[bool, str]:
         """
         Determine if we should exit a position based on risk management rules
         
+        Parameters:
+        symbol (str): Stock symbol
+        current_price (float): Latest price
+        signal_data (dict): Latest composite signal, checked for a strong sell
+        now_ns (int): Current time in epoch nanoseconds; sampled if omitted
+        
         Returns:
         tuple: (should_exit: bool, reason: str)
         """
-        if symbol not in self.current_positions:
+        i = self.table.index.get(symbol)
+        if i is None:
             return False, "No position to exit"
         
-        position = self.current_positions[symbol]
-        entry_price = position['entry_price']
+        if now_ns is None:
+            now_ns = time.time_ns()
+        reason = self._exit_reason(i, current_price, signal_data, now_ns)
+        if reason is None:
+            return False, "No exit conditions met"
+        return True, reason
+    
+    def _exit_reason(self, i: int, current_price: float, signal_data: Optional[Dict], now_ns: int) -> Optional[str]:
+        """Reason the position in table row i should be exited, or None; checks run in priority order"""
+        table = self.table
+        entry_price = float(table.entry_price[i])
         
         # Check stop loss
-        if current_price <= position['stop_loss_price']:
-            return True, f"Stop loss triggered at ${current_price:.2f} (entry: ${entry_price:.2f})"
+        if current_price <= table.stop_loss_price[i]:
+            return f"Stop loss triggered at ${current_price:.2f} (entry: ${entry_price:.2f})"
         
         # Check take profit
-        if current_price >= position['take_profit_price']:
-            return True, f"Take profit triggered at ${current_price:.2f} (entry: ${entry_price:.2f})"
+        if current_price >= table.take_profit_price[i]:
+            return f"Take profit triggered at ${current_price:.2f} (entry: ${entry_price:.2f})"
         
         # Check signal reversal
         if signal_data:
             signal = signal_data.get('overall_signal', 'HOLD')
             confidence = signal_data.get('confidence', 0)
             
-            if signal in ['SELL', 'STRONG_SELL'] and confidence >= 70:
-                return True, f"Strong sell signal: {signal} ({confidence:.1f}% confidence)"
+            if signal in self._sell_signals and confidence >= 70:
+                return f"Strong sell signal: {signal} ({confidence:.1f}% confidence)"
         
         # Check time-based exit (optional - hold for max 30 days)
-        entry_date = position.get('entry_date', datetime.now())
-        if isinstance(entry_date, str):
-            entry_date = datetime.fromisoformat(entry_date)
+        days_held = (now_ns - int(table.entry_ns[i])) // _DAY_NS
+        if days_held >= _MAX_HOLDING_DAYS:
+            return f"Maximum holding period reached ({days_held} days)"
         
-        days_held = (datetime.now() - entry_date).days
-        if days_held >= 30:
-            return True, f"Maximum holding period reached ({days_held} days)"
+        return None
+    
+    def scan_exits(self, current_prices: Dict[str, float], signals: Dict[str, Dict] = None,
+                   now_ns: int = None) -> List[Tuple[str, str]]:
+        """
+        Check every open position for an exit in one pass
+        
+        Stop-loss, take-profit and holding-period conditions are evaluated as array
+        comparisons over the whole table; reasons are only formatted for the hits.
         
-        return False, "No exit conditions met"
+        Parameters:
+        current_prices (dict): Symbol -> latest price; positions without a price can only hit the time limit
+        signals (dict): Symbol -> latest composite signal, checked for strong sells
+        now_ns (int): Current time in epoch nanoseconds; sampled if omitted
+        
+        Returns:
+        list: (symbol, reason) for each position that should be exited
+        """
+        table = self.table
+        n = table.n
+        if n == 0:
+            return []
+        if now_ns is None:
+            now_ns = time.time_ns()
+        
+        price = np.fromiter((current_prices.get(symbol, np.nan) for symbol in table.symbols),
+                            dtype=np.float64, count=n)
+        hit = _exit_mask(price, table.stop_loss_price[:n], table.take_profit_price[:n], table.entry_ns[:n],
+                         now_ns, _MAX_HOLDING_DAYS * _DAY_NS)
+        
+        # Strong sells can only come from the (few) symbols with a signal
+        if signals:
+            for symbol, signal_data in signals.items():
+                i = table.index.get(symbol)
+                if (i is not None and signal_data and signal_data.get('confidence', 0) >= 70
+                        and signal_data.get('overall_signal') in self._sell_signals):
+                    hit[i] = True
+        
+        exits = []
+        for i in np.flatnonzero(hit):
+            symbol = table.symbols[i]
+            reason = self._exit_reason(i, float(price[i]), signals.get(symbol) if signals else None, now_ns)
+            if reason is not None:
+                exits.append((symbol, reason))
+        return exits
     
-    def enter_position(self, symbol: str, position_info: Dict):
-        """Record a new position"""
-        position_info['entry_date'] = datetime.now()
-        position_info['entry_time'] = datetime.now().isoformat()
-        self.current_positions[symbol] = position_info
+    def enter_position(self, symbol: str, position_info: Dict, now_ns: int = None):
+        """Record a new position; now_ns (epoch nanoseconds) is the entry time, sampled if omitted"""
+        # One lookup both inserts and detects an existing position, which would corrupt the table
+        if self.current_positions.setdefault(symbol, position_info) is not position_info:
+            raise ValueError(f"Already have position in {symbol}")
+        entry_ns = time.time_ns() if now_ns is None else now_ns
+        i = self.table.add(symbol, position_info, entry_ns)
+        self._sum_position_value += float(self.table.position_value[i])
+        self._sum_risk_amount += float(self.table.risk_amount[i])
         
         # Update portfolio value
         self.portfolio_value -= position_info['position_value']
         
-        print(f"✅ Entered position: {symbol} - {position_info['shares']} shares at ${position_info['entry_price']:.2f}")
-        print(f"   Stop Loss: ${position_info['stop_loss_price']:.2f} | Take Profit: ${position_info['take_profit_price']:.2f}")
-        print(f"   Risk: ${position_info['risk_amount']:.2f} ({position_info['risk_percent']:.1f}%)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"✅ Entered position: {symbol} - {position_info['shares']} shares at ${position_info['entry_price']:.2f}")
+            logger.info(f"   Stop Loss: ${position_info['stop_loss_price']:.2f} | Take Profit: ${position_info['take_profit_price']:.2f}")
+            logger.info(f"   Risk: ${position_info['risk_amount']:.2f} ({position_info['risk_percent']:.1f}%)")
     
-    def exit_position(self, symbol: str, exit_price: float, reason: str = "Manual exit"):
-        """Exit a position and calculate P&L"""
-        if symbol not in self.current_positions:
+    def exit_position(self, symbol: str, exit_price: float, reason: str = "Manual exit", now_ns: int = None):
+        """Exit a position and calculate P&L; now_ns (epoch nanoseconds) is the exit time, sampled if omitted"""
+        position = self.current_positions.pop(symbol, None)
+        if position is None:
             return None
         
-        position = self.current_positions[symbol]
         shares = position['shares']
         entry_price = position['entry_price']
+        entry_ns = int(self.table.entry_ns[self.table.index[symbol]])
+        exit_ns = time.time_ns() if now_ns is None else now_ns
         
         # Calculate P&L
         exit_value = shares * exit_price
@@ -183,41 +470,82 @@ class RiskManager:
         self.portfolio_value += exit_value
         self.daily_pnl += pnl
         
-        # Create exit record
-        exit_record = {
-            'symbol': symbol,
-            'shares': shares,
-            'entry_price': entry_price,
-            'exit_price': exit_price,
-            'entry_value': entry_value,
-            'exit_value': exit_value,
-            'pnl': pnl,
-            'pnl_percent': pnl_percent,
-            'reason': reason,
-            'entry_date': position.get('entry_date'),
-            'exit_date': datetime.now(),
-            'holding_days': (datetime.now() - position.get('entry_date', datetime.now())).days
-        }
+        # Remove from the table (already popped from current positions) and log the trade
+        self._remove_from_table(symbol)
+        self._record_trade(entry_ns, exit_ns, symbol, shares, entry_price, exit_price, entry_value, pnl, reason)
         
-        # Remove from current positions
-        del self.current_positions[symbol]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"❌ Exited position: {symbol} - {shares} shares at ${exit_price:.2f}")
+            logger.info(f"   P&L: ${pnl:+.2f} ({pnl_percent:+.1f}%) | Reason: {reason}")
         
-        print(f"❌ Exited position: {symbol} - {shares} shares at ${exit_price:.2f}")
-        print(f"   P&L: ${pnl:+.2f} ({pnl_percent:+.1f}%) | Reason: {reason}")
+        return _exit_record(symbol, shares, entry_price, exit_price, entry_value, pnl, reason, entry_ns, exit_ns)
+    
+    def _record_trade(self, entry_ns: int, exit_ns: int, symbol: str, shares: int, entry_price: float,
+                      exit_price: float, entry_value: float, pnl: float, reason: str):
+        """Append one closed trade to the trade log"""
+        if self._trade_n == self._trade_log.size:
+            self._trade_log = np.resize(self._trade_log, 2 * self._trade_log.size)
+        self._trade_log[self._trade_n] = (entry_ns, exit_ns, shares, entry_price, exit_price, entry_value, pnl)
+        self._trade_symbols.append(symbol)
+        self._trade_reasons.append(reason)
+        self._trade_n += 1
+    
+    def last_trade(self) -> Optional[Dict]:
+        """
+        Most recently closed trade as an exit record
         
-        return exit_record
+        Returns:
+        dict: Symbol, shares, prices, values, P&L, reason, entry/exit dates and holding days,
+              as exit_position returns it; None if no trade has been closed
+        """
+        if self._trade_n == 0:
+            return None
+        entry_ns, exit_ns, shares, entry_price, exit_price, entry_value, pnl = self._trade_log[self._trade_n - 1].item()
+        return _exit_record(self._trade_symbols[-1], shares, entry_price, exit_price, entry_value, pnl,
+                            self._trade_reasons[-1], entry_ns, exit_ns)
+    
+    def get_trade_log(self) -> pd.DataFrame:
+        """
+        Closed trades recorded so far, oldest first
+        
+        Returns:
+        pd.DataFrame: One row per trade with entry_ns/exit_ns (epoch ns), sym, shares,
+                      entry_px, exit_px, entry_value, pnl and reason
+        """
+        trades = pd.DataFrame(self._trade_log[:self._trade_n])
+        trades.insert(2, 'sym', self._trade_symbols)
+        trades['reason'] = self._trade_reasons
+        return trades
+    
+    def _remove_from_table(self, symbol: str):
+        """Drop a position from the table and take it out of the running totals"""
+        table = self.table
+        i = table.index[symbol]
+        self._sum_position_value -= float(table.position_value[i])
+        self._sum_risk_amount -= float(table.risk_amount[i])
+        table.remove(symbol)
+        if table.n == 0:
+            # Don't let rounding residue outlive the last position
+            self._sum_position_value = 0.0
+            self._sum_risk_amount = 0.0
+    
+    def _table_totals(self) -> Tuple[float, float]:
+        """Position value and risk summed over the table in full, without touching the running totals"""
+        n = self.table.n
+        return float(self.table.position_value[:n].sum()), float(self.table.risk_amount[:n].sum())
+    
+    def _rebuild_aggregates(self) -> Tuple[float, float]:
+        """Recompute the running totals from the table (for resyncing after drift)"""
+        self._sum_position_value, self._sum_risk_amount = self._table_totals()
+        return self._sum_position_value, self._sum_risk_amount
     
     def calculate_current_portfolio_risk(self) -> float:
         """Calculate current portfolio risk exposure"""
-        total_risk = 0
-        for position in self.current_positions.values():
-            total_risk += position.get('risk_amount', 0)
-        
-        return total_risk / self.portfolio_value if self.portfolio_value > 0 else 0
+        return self._sum_risk_amount / self.portfolio_value if self.portfolio_value > 0 else 0.0
     
     def get_portfolio_summary(self) -> Dict:
         """Get current portfolio summary"""
-        total_position_value = sum(pos['position_value'] for pos in self.current_positions.values())
+        total_position_value = self._sum_position_value
         cash = self.portfolio_value
         total_portfolio_value = cash + total_position_value
         
@@ -227,21 +555,20 @@ class RiskManager:
             'invested': total_position_value,
             'num_positions': len(self.current_positions),
             'daily_pnl': self.daily_pnl,
-            'daily_pnl_percent': (self.daily_pnl / self.daily_start_value) * 100,
-            'portfolio_risk': self.calculate_current_portfolio_risk(),
-            'positions': self.current_positions
+            'daily_pnl_percent': (self.daily_pnl / self.daily_start_value) * 100 if self.daily_start_value else 0.0,
+            'portfolio_risk': self.calculate_current_portfolio_risk()
         }
     
     def update_daily_pnl(self, current_prices: Dict[str, float]):
         """Update daily P&L based on current prices"""
-        unrealized_pnl = 0
+        table = self.table
+        n = table.n
+        entry = table.entry_price[:n]
         
-        for symbol, position in self.current_positions.items():
-            if symbol in current_prices:
-                current_price = current_prices[symbol]
-                entry_price = position['entry_price']
-                shares = position['shares']
-                unrealized_pnl += shares * (current_price - entry_price)
+        # Positions without a current price contribute nothing (priced at entry)
+        price = np.fromiter((current_prices.get(symbol, e) for symbol, e in zip(table.symbols, entry)),
+                            dtype=np.float64, count=n)
+        unrealized_pnl = _unrealized(table.shares[:n], entry, price)
         
         # Total daily P&L includes realized + unrealized
         total_daily_pnl = self.daily_pnl + unrealized_pnl
@@ -249,12 +576,23 @@ class RiskManager:
     
     def reset_daily_tracking(self):
         """Reset daily tracking (call at market open)"""
+        # Resync the running totals if they have drifted from a full rescan of the table
+        totals = self._table_totals()
+        if not np.allclose((self._sum_position_value, self._sum_risk_amount), totals):
+            logger.warning("Running position totals drifted from the position table "
+                           f"({self._sum_position_value:.2f}, {self._sum_risk_amount:.2f} vs "
+                           f"{totals[0]:.2f}, {totals[1]:.2f}); rebuilding")
+            self._sum_position_value, self._sum_risk_amount = totals
         self.daily_pnl = 0
-        self.daily_start_value = self.portfolio_value + sum(pos['position_value'] for pos in self.current_positions.values())
+        # Setting the start value also moves the daily loss threshold
+        self.daily_start_value = self.portfolio_value + self._sum_position_value
     
     def get_risk_metrics(self) -> Dict:
         """Get comprehensive risk metrics"""
-        portfolio_summary = self.get_portfolio_summary()
+        # Read the running aggregates directly rather than building a full portfolio summary
+        cash = self.portfolio_value
+        invested = self._sum_position_value
+        total_value = cash + invested
         
         return {
             'max_position_size': self.max_position_size * 100,
@@ -262,8 +600,8 @@ class RiskManager:
             'stop_loss_percent': self.stop_loss_percent * 100,
             'take_profit_percent': self.take_profit_percent * 100,
             'max_portfolio_risk': self.max_portfolio_risk * 100,
-            'current_portfolio_risk': portfolio_summary['portfolio_risk'] * 100,
-            'daily_pnl_percent': portfolio_summary['daily_pnl_percent'],
-            'cash_percent': (portfolio_summary['cash'] / portfolio_summary['total_value']) * 100,
-            'invested_percent': (portfolio_summary['invested'] / portfolio_summary['total_value']) * 100
+            'current_portfolio_risk': self.calculate_current_portfolio_risk() * 100,
+            'daily_pnl_percent': (self.daily_pnl / self.daily_start_value) * 100 if self.daily_start_value else 0.0,
+            'cash_percent': (cash / total_value) * 100,
+            'invested_percent': (invested / total_value) * 100
         }
\ No newline at end of file
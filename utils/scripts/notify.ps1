@@ -0,0 +1,9 @@
+param([string]$Title, [string]$Message)
+
+Add-Type -AssemblyName System.Windows.Forms
+$notification = New-Object System.Windows.Forms.NotifyIcon
+$notification.Icon = [System.Drawing.SystemIcons]::Information
+$notification.BalloonTipTitle = $Title
+$notification.BalloonTipText = $Message
+$notification.Visible = $true
+$notification.ShowBalloonTip(5000)